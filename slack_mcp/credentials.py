@@ -1,7 +1,10 @@
 """Secure credential management using macOS Keychain."""
 
+import functools
 import os
 import sys
+import threading
+import time
 import logging
 from typing import Optional, Dict, Any
 import keyring
@@ -10,30 +13,161 @@ from typing import List
 
 logger = logging.getLogger(__name__)
 
+# Bound logging methods save an attribute lookup per call in the hot
+# credential paths
+_debug = logger.debug
+_info = logger.info
+_warning = logger.warning
+_error = logger.error
+
 # Service name for keychain entries
 SERVICE_NAME = "slack-mcp-server"
 
+# Platform check is immutable for the process lifetime, so do it once
+_IS_DARWIN: bool = sys.platform == "darwin"
+
+# How long (seconds) a cached miss stays valid before the keychain is
+# re-queried; positive results never expire
+_NEG_TTL: float = 60.0
+
+# Sentinel distinguishing "not cached" from a cached None
+_MISSING = object()
+
+# Environment-variable fallbacks for the known credential keys, spelled
+# out so the non-darwin path never rebuilds "SLACK_<KEY>" at runtime
+_ENV_VAR_MAP = {
+    "api_token": "SLACK_API_TOKEN",
+    "workspace_id": "SLACK_WORKSPACE_ID",
+    "app_token": "SLACK_APP_TOKEN",
+    "signing_secret": "SLACK_SIGNING_SECRET",
+}
+
+
+def _keyring_op(action: str, acting: str, default):
+    """Decorate a keyring-touching method with the shared error handling.
+
+    Maps KeyringError (and anything unexpected) to a log line plus the
+    method's failure value, so each operation doesn't repeat the same
+    two except blocks.
+    """
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            # Callers may pass key positionally or by keyword; pull it out
+            # for the log lines without constraining how fn is invoked
+            key = kwargs.get("key", args[0] if args else None)
+            try:
+                return fn(self, *args, **kwargs)
+            except KeyringError as e:
+                _error("Failed to %s credential '%s': %s", action, key, e)
+                return default
+            except Exception as e:
+                _error("Unexpected error %s credential '%s': %s", acting, key, e)
+                return default
+
+        return wrapper
+
+    return decorator
+
 
 class CredentialManager:
     """Manages secure storage and retrieval of Slack API credentials."""
 
-    def __init__(self, service_name: str = SERVICE_NAME):
+    # Every credential key this server knows about
+    _ALL_KEYS = (
+        "api_token",  # Bot User OAuth Token
+        "workspace_id",  # Slack Workspace ID (optional)
+        "app_token",  # App-level token for Socket Mode (optional)
+        "signing_secret",  # App signing secret (optional)
+    )
+
+    # Required vs. optional split used by validate_credentials
+    _REQUIRED = frozenset({"api_token"})
+    _OPTIONAL = frozenset({"workspace_id", "app_token", "signing_secret"})
+
+    def __init__(self, service_name: str = SERVICE_NAME, eager: bool = True):
+        """
+        Args:
+            service_name: Keychain service name for stored entries
+            eager: Prefetch all known credentials at construction so a
+                locked keychain prompts at most once. Pass False to keep
+                lookups fully lazy (useful in tests).
+        """
         self.service_name = service_name
+        # In-process cache of (value, monotonic timestamp) pairs, including
+        # None values for known misses, so repeated lookups skip the
+        # keychain / environment. Misses expire after _NEG_TTL so a
+        # credential added mid-process is eventually picked up.
+        self._cache: Dict[str, tuple] = {}
+        # Guards cache fills so concurrent first reads issue one backend
+        # query instead of racing each other into the keychain
+        self._lock = threading.RLock()
         self._ensure_keychain_available()
+        if eager and _IS_DARWIN:
+            try:
+                self._prefetch_all()
+            except KeyringError:
+                # Lookups will retry lazily (and log) on first access
+                pass
+
+    # Whether the keychain backend probe already ran (shared process-wide;
+    # the backend doesn't change between instances)
+    _probed = False
 
     def _ensure_keychain_available(self) -> None:
         """Ensure keychain is available on macOS."""
-        if sys.platform != "darwin":
-            logger.warning("Keychain storage is only available on macOS. Falling back to environment variables.")
+        if CredentialManager._probed:
+            return
+
+        if not _IS_DARWIN:
+            _warning("Keychain storage is only available on macOS. Falling back to environment variables.")
+            CredentialManager._probed = True
             return
 
         try:
             # Test keychain access
             keyring.get_keyring()
+            CredentialManager._probed = True
         except Exception as e:
-            logger.error(f"Failed to access keychain: {e}")
+            _error("Failed to access keychain: %s", e)
             raise RuntimeError("Keychain access failed. Please ensure your macOS keychain is unlocked.")
 
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """
+        Drop cached credential values.
+
+        Args:
+            key: The credential identifier to invalidate, or None to clear
+                the entire cache
+        """
+        if key is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(key, None)
+
+    def invalidate_negatives(self) -> None:
+        """Drop only the cached misses, keeping known-good values."""
+        for key in [k for k, (value, _) in self._cache.items() if value is None]:
+            del self._cache[key]
+
+    def _peek(self, key: str) -> Optional[str]:
+        """Read a cached value without consulting the backend."""
+        cached = self._cache.get(key)
+        return cached[0] if cached is not None else None
+
+    def _prefetch_all(self) -> None:
+        """Load every known credential into the cache in one pass.
+
+        Aggregator methods fan out over `_ALL_KEYS`; fetching them together
+        keeps the keychain round-trips to one batch per cache lifetime
+        instead of one per aggregator call.
+        """
+        with self._lock:
+            for key in self._ALL_KEYS:
+                self.get_credential(key)
+
+    @_keyring_op("store", "storing", False)
     def store_credential(self, key: str, value: str) -> bool:
         """
         Store a credential securely in the macOS Keychain.
@@ -45,21 +179,32 @@ class CredentialManager:
         Returns:
             bool: True if stored successfully, False otherwise
         """
-        try:
-            if sys.platform == "darwin":
-                keyring.set_password(self.service_name, key, value)
-                logger.info(f"Credential '{key}' stored successfully in keychain")
-                return True
-            else:
-                logger.warning(f"Cannot store credential '{key}' - keychain only available on macOS")
-                return False
-        except KeyringError as e:
-            logger.error(f"Failed to store credential '{key}': {e}")
-            return False
-        except Exception as e:
-            logger.error(f"Unexpected error storing credential '{key}': {e}")
+        if not _IS_DARWIN:
+            _warning("Cannot store credential '%s' - keychain only available on macOS", key)
             return False
 
+        keyring.set_password(self.service_name, key, value)
+        self._cache[key] = (value, time.monotonic())
+        _info("Credential '%s' stored successfully in keychain", key)
+        return True
+
+    def store_credentials(self, credentials: Dict[str, str]) -> Dict[str, bool]:
+        """
+        Store several credentials in one batch.
+
+        The keychain round-trips run back to back under the cache lock, so
+        a locked keychain prompts once for the whole batch instead of once
+        per credential.
+
+        Args:
+            credentials: Mapping of credential identifiers to values
+
+        Returns:
+            Dict[str, bool]: Per-key success flags
+        """
+        with self._lock:
+            return {key: self.store_credential(key, value) for key, value in credentials.items()}
+
     def get_credential(self, key: str) -> Optional[str]:
         """
         Retrieve a credential from the macOS Keychain.
@@ -70,27 +215,51 @@ class CredentialManager:
         Returns:
             str: The credential value, or None if not found
         """
-        try:
-            if sys.platform == "darwin":
-                credential = keyring.get_password(self.service_name, key)
-                if credential:
-                    logger.debug(f"Retrieved credential '{key}' from keychain")
-                    return credential
-                else:
-                    logger.debug(f"Credential '{key}' not found in keychain")
-                    return None
-            else:
-                logger.debug(f"Keychain not available - falling back to environment variable for '{key}'")
-                # Fallback to environment variables on non-macOS systems
-                env_key = f"SLACK_{key.upper()}"
-                return os.getenv(env_key)
-        except KeyringError as e:
-            logger.error(f"Failed to retrieve credential '{key}': {e}")
-            return None
-        except Exception as e:
-            logger.error(f"Unexpected error retrieving credential '{key}': {e}")
-            return None
-
+        value = self._get_cached(key)
+        if value is not _MISSING:
+            return value
+
+        with self._lock:
+            # Double-checked: another thread may have filled the cache while
+            # we waited on the lock
+            value = self._get_cached(key)
+            if value is not _MISSING:
+                return value
+            return self._fetch_credential(key)
+
+    def _get_cached(self, key: str):
+        """Return the cached value for key, or _MISSING if it must be fetched."""
+        cached = self._cache.get(key)
+        if cached is not None:
+            value, cached_at = cached
+            if value is not None or time.monotonic() - cached_at < _NEG_TTL:
+                return value
+            # Cached miss expired - caller should re-query the backend
+        return _MISSING
+
+    @_keyring_op("retrieve", "retrieving", None)
+    def _fetch_credential(self, key: str) -> Optional[str]:
+        """Fetch a credential from the backend and cache the result."""
+        if not _IS_DARWIN:
+            _debug("Keychain not available - falling back to environment variable for '%s'", key)
+            # Fallback to environment variables on non-macOS systems
+            env_key = _ENV_VAR_MAP.get(key) or f"SLACK_{key.upper()}"
+            credential = os.getenv(env_key)
+            self._cache[key] = (credential, time.monotonic())
+            return credential
+
+        credential = keyring.get_password(self.service_name, key)
+        if credential:
+            _debug("Retrieved credential '%s' from keychain", key)
+        else:
+            _debug("Credential '%s' not found in keychain", key)
+
+        # Cache the result (including None) so repeated lookups for a
+        # missing credential don't re-hit the keychain.
+        self._cache[key] = (credential, time.monotonic())
+        return credential
+
+    @_keyring_op("delete", "deleting", False)
     def delete_credential(self, key: str) -> bool:
         """
         Delete a credential from the macOS Keychain.
@@ -101,21 +270,15 @@ class CredentialManager:
         Returns:
             bool: True if deleted successfully, False otherwise
         """
-        try:
-            if sys.platform == "darwin":
-                keyring.delete_password(self.service_name, key)
-                logger.info(f"Credential '{key}' deleted from keychain")
-                return True
-            else:
-                logger.warning(f"Cannot delete credential '{key}' - keychain only available on macOS")
-                return False
-        except KeyringError as e:
-            logger.error(f"Failed to delete credential '{key}': {e}")
-            return False
-        except Exception as e:
-            logger.error(f"Unexpected error deleting credential '{key}': {e}")
+        if not _IS_DARWIN:
+            _warning("Cannot delete credential '%s' - keychain only available on macOS", key)
             return False
 
+        keyring.delete_password(self.service_name, key)
+        self._cache.pop(key, None)
+        _info("Credential '%s' deleted from keychain", key)
+        return True
+
     def list_stored_credentials(self) -> List[str]:
         """
         List all stored credential keys for this service.
@@ -126,13 +289,9 @@ class CredentialManager:
             List[str]: List of credential keys that are commonly used
         """
         common_keys = ["api_token", "workspace_id", "app_token"]
-        stored_keys = []
 
-        for key in common_keys:
-            if self.get_credential(key) is not None:
-                stored_keys.append(key)
-
-        return stored_keys
+        self._prefetch_all()
+        return [key for key in common_keys if self._peek(key) is not None]
 
     def get_all_credentials(self) -> Dict[str, Optional[str]]:
         """
@@ -141,20 +300,8 @@ class CredentialManager:
         Returns:
             Dict[str, Optional[str]]: Dictionary of credential keys and values
         """
-        credentials = {}
-
-        # Standard Slack credentials
-        credential_keys = [
-            "api_token",  # Bot User OAuth Token
-            "workspace_id",  # Slack Workspace ID (optional)
-            "app_token",  # App-level token for Socket Mode (optional)
-            "signing_secret",  # App signing secret (optional)
-        ]
-
-        for key in credential_keys:
-            credentials[key] = self.get_credential(key)
-
-        return credentials
+        self._prefetch_all()
+        return {key: self._peek(key) for key in self._ALL_KEYS}
 
     def validate_credentials(self) -> Dict[str, Any]:
         """
@@ -163,33 +310,23 @@ class CredentialManager:
         Returns:
             Dict[str, Any]: Validation result with status and details
         """
-        result = {"valid": True, "missing": [], "present": [], "errors": []}
+        self._prefetch_all()
 
-        # Required credentials
-        required_keys = ["api_token"]
+        present = [key for key in self._ALL_KEYS if self._peek(key)]
+        missing = [key for key in self._ALL_KEYS if key in self._REQUIRED and not self._peek(key)]
 
-        # Optional credentials
-        optional_keys = ["workspace_id", "app_token", "signing_secret"]
+        result = {"valid": not missing, "missing": missing, "present": present, "errors": []}
 
-        # Check required credentials
-        for key in required_keys:
-            credential = self.get_credential(key)
-            if credential:
-                result["present"].append(key)
-            else:
-                result["missing"].append(key)
-                result["valid"] = False
+        if missing:
+            result["errors"].append(f"Missing required credentials: {', '.join(missing)}")
 
-        # Check optional credentials
-        for key in optional_keys:
-            credential = self.get_credential(key)
-            if credential:
-                result["present"].append(key)
+        return result
 
-        if not result["valid"]:
-            result["errors"].append(f"Missing required credentials: {', '.join(result['missing'])}")
 
-        return result
+@functools.lru_cache(maxsize=1)
+def _default_manager() -> CredentialManager:
+    """Return the shared CredentialManager for the default service name."""
+    return CredentialManager()
 
 
 def get_slack_credentials() -> Dict[str, Optional[str]]:
@@ -199,8 +336,7 @@ def get_slack_credentials() -> Dict[str, Optional[str]]:
     Returns:
         Dict[str, Optional[str]]: Dictionary of credential keys and values
     """
-    manager = CredentialManager()
-    return manager.get_all_credentials()
+    return _default_manager().get_all_credentials()
 
 
 def setup_credential(key: str, value: str) -> bool:
@@ -214,5 +350,4 @@ def setup_credential(key: str, value: str) -> bool:
     Returns:
         bool: True if stored successfully
     """
-    manager = CredentialManager()
-    return manager.store_credential(key, value)
+    return _default_manager().store_credential(key, value)
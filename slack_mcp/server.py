@@ -1,23 +1,193 @@
 """Slack MCP Server implementation."""
 
+import asyncio
+import contextlib
+import functools
+import inspect
 import os
 import json
 import logging
-from typing import Optional, List, Dict, Any
+import re
+import time
+from typing import Optional, List, Dict, Any, Union
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
 import httpx
 from fastmcp import FastMCP
 from .credentials import CredentialManager, get_slack_credentials
 
-load_dotenv()
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
-logging.basicConfig(level=logging.INFO)
+# Guard the import-time side effects so re-imports (common under test
+# harnesses) skip the .env filesystem walk and the root-logger lock
+if not getattr(load_dotenv, "_called", False):
+    load_dotenv()
+    load_dotenv._called = True
+
+if not logging.getLogger().handlers:
+    logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 mcp = FastMCP("slack-mcp-server")
 
 
+def _dump(obj: Any) -> str:
+    """Serialize a tool response to pretty-printed JSON.
+
+    Uses orjson when available (native encoder, roughly an order of
+    magnitude faster on large Slack payloads), falling back to stdlib json.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
+def _now_stamp() -> str:
+    """Format the current local time as YYYY-MM-DD HH:MM.
+
+    Formats the datetime fields directly, skipping strftime's per-call
+    parse of the format string - several times faster for a fixed layout.
+    """
+    now = datetime.now()
+    return f"{now.year:04d}-{now.month:02d}-{now.day:02d} {now.hour:02d}:{now.minute:02d}"
+
+
+def _loads(raw: str) -> Any:
+    """Parse a JSON tool argument with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _error_response(e: Exception) -> str:
+    """Serialize an exception into the shared error payload.
+
+    The exception class name rides along so clients can tell a Slack API
+    failure from a bad argument without parsing the message text.
+    """
+    return _dump({"error": str(e), "type": type(e).__name__})
+
+
+def _json_tool(fn):
+    """Register an async function as an MCP tool returning JSON.
+
+    Tool bodies return plain dicts; this wrapper serializes them with
+    _dump and maps any exception to an {"error": ...} payload, replacing
+    the identical try/except/json boilerplate every tool used to carry.
+    """
+
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs) -> str:
+        try:
+            return _dump(await fn(*args, **kwargs))
+        except Exception as e:
+            return _error_response(e)
+
+    # wraps copies fn's annotations (and __wrapped__, which
+    # inspect.signature follows) wholesale, including its dict return
+    # type; the wrapper actually returns serialized JSON, and FastMCP
+    # derives the tool's output schema from the signature, so restore
+    # the str contract before registration
+    wrapper.__annotations__ = {**fn.__annotations__, "return": str}
+    wrapper.__signature__ = inspect.signature(fn).replace(return_annotation=str)
+    return mcp.tool()(wrapper)
+
+
+# HTTP/2 lets concurrent tool calls multiplex over one connection instead
+# of queueing behind HTTP/1.1 keep-alive; httpx needs the optional h2
+# package for it, so only enable when that's installed
+try:
+    import h2  # noqa: F401
+
+    _HTTP2 = True
+except ImportError:
+    _HTTP2 = False
+
+# Shared HTTP client so every Slack call reuses the same connection pool
+# (and TLS session) instead of paying a fresh handshake per request
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+async def get_http_client() -> httpx.AsyncClient:
+    """Return the shared httpx.AsyncClient, creating it on first use."""
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(
+            timeout=30.0,
+            http2=_HTTP2,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client (called on server shutdown)."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+class _RateLimiter:
+    """Minimal token bucket for pacing calls under one Slack rate-limit tier.
+
+    State updates happen between awaits on a single event loop, so no lock
+    is needed; concurrent waiters simply re-check after sleeping.
+    """
+
+    def __init__(self, per_minute: float):
+        self._capacity = per_minute
+        self._fill_rate = per_minute / 60.0
+        self._tokens = per_minute
+        self._updated = time.monotonic()
+
+    async def acquire(self) -> None:
+        """Wait until a request token is available, then consume it."""
+        while True:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._fill_rate)
+            self._updated = now
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return
+            await asyncio.sleep((1.0 - self._tokens) / self._fill_rate)
+
+
+# Client-side pacing per Slack's published tiers
+# (https://api.slack.com/apis/rate-limits); staying under the caps avoids
+# burst 429s and the cooldown they impose
+_TIER_2 = _RateLimiter(20)
+_TIER_3 = _RateLimiter(50)
+
+_ENDPOINT_TIERS = {
+    "conversations.list": _TIER_2,
+    "users.list": _TIER_2,
+    "search.messages": _TIER_2,
+}
+
+# How many times to retry a rate-limited request before giving up
+_MAX_429_RETRIES = 3
+
+
+# Endpoints whose payloads routinely run to multiple MB; their responses
+# are streamed rather than buffered eagerly by httpx
+_LARGE_ENDPOINTS = frozenset({"conversations.history", "users.list", "search.messages"})
+
+# Per-endpoint TTLs (seconds) for read-mostly metadata GETs. These change
+# on the order of minutes, so short local caching turns repeat lookups into
+# dict hits instead of ~100ms round trips.
+_CACHE_TTL = {
+    "team.info": 300,
+    "users.list": 60,
+    "users.info": 120,
+    "conversations.info": 60,
+    "conversations.list": 30,
+}
+
+
 class SlackClient:
     """Client for interacting with Slack Web API."""
 
@@ -30,21 +200,29 @@ class SlackClient:
         self.api_token = credentials.get("api_token") or os.getenv("SLACK_API_TOKEN")
         self.workspace_id = credentials.get("workspace_id") or os.getenv("SLACK_WORKSPACE_ID")
 
+        # The auth header never changes for the lifetime of the client, so
+        # build both variants once instead of formatting them per request.
+        # GETs carry no body, so they skip Content-Type entirely. Treated
+        # as immutable from here on.
+        self._get_headers = {"Authorization": f"Bearer {self.api_token}"}
+        self._json_headers = {**self._get_headers, "Content-Type": "application/json"}
+
+        # TTL cache of (response, monotonic timestamp) for the metadata
+        # endpoints listed in _CACHE_TTL, keyed on (endpoint, params)
+        self._response_cache: Dict[tuple, tuple] = {}
+
         # Log credential source (without exposing values)
         if credentials.get("api_token"):
             logger.debug("Using API token from keychain")
         elif os.getenv("SLACK_API_TOKEN"):
             logger.debug("Using API token from environment variable")
         else:
+            # Fail fast here so every request doesn't re-discover the same
+            # missing token
             logger.warning("No API token found in keychain or environment variables")
-
-    def _validate_config(self) -> bool:
-        """Validate that required configuration is present."""
-        if not self.api_token:
-            logger.warning("Slack API token not found in keychain or environment variables")
-            logger.info("Use 'python -m slack_mcp.setup' to configure credentials securely")
-            return False
-        return True
+            raise ValueError(
+                "Slack API token not configured. Use 'python -m slack_mcp.setup' to configure credentials."
+            )
 
     async def _make_request(
         self,
@@ -54,24 +232,64 @@ class SlackClient:
         json_data: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """Make an authenticated request to the Slack API."""
-        if not self._validate_config():
-            raise ValueError(
-                "Slack API token not configured. Use 'python -m slack_mcp.setup' to configure credentials."
-            )
+        ttl = _CACHE_TTL.get(endpoint) if method == "GET" else None
+        if ttl is not None:
+            cache_key = (endpoint, tuple(sorted((params or {}).items())))
+            cached = self._response_cache.get(cache_key)
+            if cached is not None and time.monotonic() - cached[1] < ttl:
+                return cached[0]
 
         url = f"{self.base_url}/{endpoint}"
-        headers = {"Authorization": f"Bearer {self.api_token}", "Content-Type": "application/json"}
 
-        async with httpx.AsyncClient() as client:
-            response = await client.request(method, url, headers=headers, params=params, json=json_data, timeout=30.0)
+        client = await get_http_client()
+        headers = self._json_headers if json_data is not None else self._get_headers
+        limiter = _ENDPOINT_TIERS.get(endpoint, _TIER_3)
+
+        for attempt in range(_MAX_429_RETRIES + 1):
+            await limiter.acquire()
+            if endpoint in _LARGE_ENDPOINTS:
+                # Stream bulk responses so httpx doesn't hold the body
+                # buffered a second time before we read it
+                async with client.stream(method, url, headers=headers, params=params, json=json_data) as response:
+                    if response.status_code != 429:
+                        content = await response.aread()
+                        break
+            else:
+                response = await client.request(method, url, headers=headers, params=params, json=json_data)
+                if response.status_code != 429:
+                    content = response.content
+                    break
+            if attempt == _MAX_429_RETRIES:
+                # No retry left - don't sit out the cooldown just to raise
+                continue
+            # Honor Slack's cooldown, falling back to exponential backoff.
+            # Retry-After may also be an HTTP-date, which float() rejects.
+            try:
+                retry_after = float(response.headers.get("Retry-After", 2**attempt))
+            except ValueError:
+                retry_after = float(2**attempt)
+            logger.warning("Rate limited on %s - retrying in %.1fs", endpoint, retry_after)
+            await asyncio.sleep(retry_after)
+        else:
+            raise Exception(f"Slack API error: rate limited on {endpoint} after {_MAX_429_RETRIES} retries")
+
+        # Parse from the raw bytes with orjson when available; this skips
+        # both stdlib json.loads and the UTF-8 decode pass response.json()
+        # performs, which matters on bulk endpoints like
+        # conversations.history and users.list.
+        if orjson is not None:
+            data = orjson.loads(content)
+        else:
+            data = json.loads(content)
 
-            data = response.json()
+        if not data.get("ok", False):
+            error_msg = data.get("error", "Unknown error")
+            raise Exception(f"Slack API error: {error_msg}")
 
-            if not data.get("ok", False):
-                error_msg = data.get("error", "Unknown error")
-                raise Exception(f"Slack API error: {error_msg}")
+        if ttl is not None:
+            self._response_cache[cache_key] = (data, time.monotonic())
 
-            return data
+        return data
 
     async def list_channels(
         self, types: Optional[List[str]] = None, exclude_archived: bool = True, limit: int = 100
@@ -113,6 +331,18 @@ class SlackClient:
 
         return await self._make_request("POST", "chat.postMessage", json_data=data)
 
+    async def broadcast_message(
+        self,
+        channels: List[str],
+        text: str,
+        thread_ts: Optional[str] = None,
+        blocks: Optional[List[Dict[str, Any]]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Send the same message to several channels concurrently."""
+        # gather fans the posts out over the shared connection pool, so an
+        # N-channel broadcast costs ~1 round trip instead of N
+        return list(await asyncio.gather(*(self.send_message(channel, text, thread_ts, blocks) for channel in channels)))
+
     async def update_message(
         self, channel: str, ts: str, text: str, blocks: Optional[List[Dict[str, Any]]] = None
     ) -> Dict[str, Any]:
@@ -157,14 +387,21 @@ class SlackClient:
 
     async def upload_file(
         self,
-        channels: List[str],
+        channels: Union[str, List[str]],
         content: str,
         filename: str,
         title: Optional[str] = None,
         initial_comment: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """Upload a file to one or more channels."""
-        data = {"channels": ",".join(channels), "content": content, "filename": filename}
+        """Upload a file to one or more channels.
+
+        Slack wants a comma-separated string, so one passed by the caller
+        is forwarded as-is instead of being split and re-joined.
+        """
+        if not isinstance(channels, str):
+            channels = ",".join(channels)
+
+        data = {"channels": channels, "content": content, "filename": filename}
 
         if title:
             data["title"] = title
@@ -203,9 +440,16 @@ class SlackClient:
         data = {"channel": channel}
         return await self._make_request("POST", "conversations.unarchive", json_data=data)
 
-    async def invite_to_channel(self, channel: str, users: List[str]) -> Dict[str, Any]:
-        """Invite users to a channel."""
-        data = {"channel": channel, "users": ",".join(users)}
+    async def invite_to_channel(self, channel: str, users: Union[str, List[str]]) -> Dict[str, Any]:
+        """Invite users to a channel.
+
+        Accepts the comma-separated string Slack wants directly, or a list
+        to join on the caller's behalf.
+        """
+        if not isinstance(users, str):
+            users = ",".join(users)
+
+        data = {"channel": channel, "users": users}
         return await self._make_request("POST", "conversations.invite", json_data=data)
 
     async def set_channel_topic(self, channel: str, topic: str) -> Dict[str, Any]:
@@ -219,8 +463,20 @@ class SlackClient:
         return await self._make_request("POST", "conversations.setPurpose", json_data=data)
 
 
-@mcp.tool()
-async def list_channels(types: Optional[str] = None, exclude_archived: bool = True, limit: int = 100) -> str:
+# Shared SlackClient so tool calls don't re-read credentials per invocation
+_client: Optional[SlackClient] = None
+
+
+def get_client() -> SlackClient:
+    """Return the shared SlackClient, constructing it on first use."""
+    global _client
+    if _client is None:
+        _client = SlackClient()
+    return _client
+
+
+@_json_tool
+async def list_channels(types: Optional[str] = None, exclude_archived: bool = True, limit: int = 100) -> Dict[str, Any]:
     """
     List all channels in the Slack workspace.
 
@@ -229,33 +485,27 @@ async def list_channels(types: Optional[str] = None, exclude_archived: bool = Tr
         exclude_archived: Whether to exclude archived channels
         limit: Maximum number of channels to return (1-1000)
     """
-    try:
-        client = SlackClient()
-        types_list = types.split(",") if types else None
-        result = await client.list_channels(types_list, exclude_archived, limit)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+    client = get_client()
+    types_list = types.split(",") if types else None
+    result = await client.list_channels(types_list, exclude_archived, limit)
+    return result
 
 
-@mcp.tool()
-async def get_channel_info(channel_id: str) -> str:
+@_json_tool
+async def get_channel_info(channel_id: str) -> Dict[str, Any]:
     """
     Get detailed information about a specific Slack channel.
 
     Args:
         channel_id: The ID of the channel
     """
-    try:
-        client = SlackClient()
-        result = await client.get_channel_info(channel_id)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+    client = get_client()
+    result = await client.get_channel_info(channel_id)
+    return result
 
 
-@mcp.tool()
-async def list_users(limit: int = 100, include_locale: bool = False) -> str:
+@_json_tool
+async def list_users(limit: int = 100, include_locale: bool = False) -> Dict[str, Any]:
     """
     List all users in the Slack workspace.
 
@@ -263,32 +513,26 @@ async def list_users(limit: int = 100, include_locale: bool = False) -> str:
         limit: Maximum number of users to return
         include_locale: Include locale information for each user
     """
-    try:
-        client = SlackClient()
-        result = await client.list_users(limit, include_locale)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+    client = get_client()
+    result = await client.list_users(limit, include_locale)
+    return result
 
 
-@mcp.tool()
-async def get_user_info(user_id: str) -> str:
+@_json_tool
+async def get_user_info(user_id: str) -> Dict[str, Any]:
     """
     Get detailed information about a specific Slack user.
 
     Args:
         user_id: The ID of the user
     """
-    try:
-        client = SlackClient()
-        result = await client.get_user_info(user_id)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+    client = get_client()
+    result = await client.get_user_info(user_id)
+    return result
 
 
-@mcp.tool()
-async def send_message(channel: str, text: str, thread_ts: Optional[str] = None, blocks: Optional[str] = None) -> str:
+@_json_tool
+async def send_message(channel: str, text: str, thread_ts: Optional[str] = None, blocks: Union[str, List[Dict[str, Any]], None] = None) -> Dict[str, Any]:
     """
     Send a message to a Slack channel.
 
@@ -296,19 +540,36 @@ async def send_message(channel: str, text: str, thread_ts: Optional[str] = None,
         channel: Channel ID or name
         text: Message text (fallback text for notifications)
         thread_ts: Thread timestamp for replies
-        blocks: JSON string of Block Kit blocks for rich formatting
+        blocks: Block Kit blocks for rich formatting, as a JSON string or
+            an already-parsed list
     """
-    try:
-        client = SlackClient()
-        blocks_data = json.loads(blocks) if blocks else None
-        result = await client.send_message(channel, text, thread_ts, blocks_data)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+    client = get_client()
+    blocks_data = _parse_blocks(blocks)
+    result = await client.send_message(channel, text, thread_ts, blocks_data)
+    return result
 
 
-@mcp.tool()
-async def update_message(channel: str, ts: str, text: str, blocks: Optional[str] = None) -> str:
+@_json_tool
+async def broadcast_message(channels: str, text: str, thread_ts: Optional[str] = None, blocks: Union[str, List[Dict[str, Any]], None] = None) -> Dict[str, Any]:
+    """
+    Send the same message to multiple Slack channels concurrently.
+
+    Args:
+        channels: Comma-separated list of channel IDs or names
+        text: Message text (fallback text for notifications)
+        thread_ts: Thread timestamp for replies
+        blocks: Block Kit blocks for rich formatting, as a JSON string or
+            an already-parsed list
+    """
+    client = get_client()
+    channel_list = [channel.strip() for channel in channels.split(",") if channel.strip()]
+    blocks_data = _parse_blocks(blocks)
+    results = await client.broadcast_message(channel_list, text, thread_ts, blocks_data)
+    return {"ok": all(result.get("ok", False) for result in results), "results": results}
+
+
+@_json_tool
+async def update_message(channel: str, ts: str, text: str, blocks: Union[str, List[Dict[str, Any]], None] = None) -> Dict[str, Any]:
     """
     Update an existing Slack message.
 
@@ -316,19 +577,17 @@ async def update_message(channel: str, ts: str, text: str, blocks: Optional[str]
         channel: Channel ID where the message exists
         ts: Timestamp of the message to update
         text: New message text (fallback text for notifications)
-        blocks: JSON string of Block Kit blocks for rich formatting
+        blocks: Block Kit blocks for rich formatting, as a JSON string or
+            an already-parsed list
     """
-    try:
-        client = SlackClient()
-        blocks_data = json.loads(blocks) if blocks else None
-        result = await client.update_message(channel, ts, text, blocks_data)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+    client = get_client()
+    blocks_data = _parse_blocks(blocks)
+    result = await client.update_message(channel, ts, text, blocks_data)
+    return result
 
 
-@mcp.tool()
-async def delete_message(channel: str, ts: str) -> str:
+@_json_tool
+async def delete_message(channel: str, ts: str) -> Dict[str, Any]:
     """
     Delete a message from a Slack channel.
 
@@ -336,18 +595,15 @@ async def delete_message(channel: str, ts: str) -> str:
         channel: Channel ID where the message exists
         ts: Timestamp of the message to delete
     """
-    try:
-        client = SlackClient()
-        result = await client.delete_message(channel, ts)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+    client = get_client()
+    result = await client.delete_message(channel, ts)
+    return result
 
 
-@mcp.tool()
+@_json_tool
 async def get_channel_history(
     channel: str, limit: int = 100, oldest: Optional[str] = None, latest: Optional[str] = None
-) -> str:
+) -> Dict[str, Any]:
     """
     Get message history for a Slack channel.
 
@@ -357,16 +613,13 @@ async def get_channel_history(
         oldest: Only messages after this timestamp
         latest: Only messages before this timestamp
     """
-    try:
-        client = SlackClient()
-        result = await client.get_channel_history(channel, limit, oldest, latest)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+    client = get_client()
+    result = await client.get_channel_history(channel, limit, oldest, latest)
+    return result
 
 
-@mcp.tool()
-async def search_messages(query: str, sort: str = "timestamp", sort_dir: str = "desc", count: int = 20) -> str:
+@_json_tool
+async def search_messages(query: str, sort: str = "timestamp", sort_dir: str = "desc", count: int = 20) -> Dict[str, Any]:
     """
     Search for messages across the Slack workspace.
 
@@ -376,18 +629,15 @@ async def search_messages(query: str, sort: str = "timestamp", sort_dir: str = "
         sort_dir: Sort direction 'asc' or 'desc'
         count: Number of results to return
     """
-    try:
-        client = SlackClient()
-        result = await client.search_messages(query, sort, sort_dir, count)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+    client = get_client()
+    result = await client.search_messages(query, sort, sort_dir, count)
+    return result
 
 
-@mcp.tool()
+@_json_tool
 async def upload_file(
     channels: str, content: str, filename: str, title: Optional[str] = None, initial_comment: Optional[str] = None
-) -> str:
+) -> Dict[str, Any]:
     """
     Upload a file to one or more Slack channels.
 
@@ -398,17 +648,13 @@ async def upload_file(
         title: Title of the file
         initial_comment: Initial comment for the file
     """
-    try:
-        client = SlackClient()
-        channels_list = channels.split(",")
-        result = await client.upload_file(channels_list, content, filename, title, initial_comment)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+    client = get_client()
+    result = await client.upload_file(channels, content, filename, title, initial_comment)
+    return result
 
 
-@mcp.tool()
-async def add_reaction(channel: str, timestamp: str, emoji_name: str) -> str:
+@_json_tool
+async def add_reaction(channel: str, timestamp: str, emoji_name: str) -> Dict[str, Any]:
     """
     Add a reaction emoji to a message.
 
@@ -417,16 +663,13 @@ async def add_reaction(channel: str, timestamp: str, emoji_name: str) -> str:
         timestamp: Timestamp of the message
         emoji_name: Name of the emoji (without colons)
     """
-    try:
-        client = SlackClient()
-        result = await client.add_reaction(channel, timestamp, emoji_name)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+    client = get_client()
+    result = await client.add_reaction(channel, timestamp, emoji_name)
+    return result
 
 
-@mcp.tool()
-async def remove_reaction(channel: str, timestamp: str, emoji_name: str) -> str:
+@_json_tool
+async def remove_reaction(channel: str, timestamp: str, emoji_name: str) -> Dict[str, Any]:
     """
     Remove a reaction emoji from a message.
 
@@ -435,27 +678,21 @@ async def remove_reaction(channel: str, timestamp: str, emoji_name: str) -> str:
         timestamp: Timestamp of the message
         emoji_name: Name of the emoji (without colons)
     """
-    try:
-        client = SlackClient()
-        result = await client.remove_reaction(channel, timestamp, emoji_name)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+    client = get_client()
+    result = await client.remove_reaction(channel, timestamp, emoji_name)
+    return result
 
 
-@mcp.tool()
-async def get_team_info() -> str:
+@_json_tool
+async def get_team_info() -> Dict[str, Any]:
     """Get information about the Slack workspace/team."""
-    try:
-        client = SlackClient()
-        result = await client.get_team_info()
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+    client = get_client()
+    result = await client.get_team_info()
+    return result
 
 
-@mcp.tool()
-async def create_channel(name: str, is_private: bool = False) -> str:
+@_json_tool
+async def create_channel(name: str, is_private: bool = False) -> Dict[str, Any]:
     """
     Create a new Slack channel.
 
@@ -463,48 +700,39 @@ async def create_channel(name: str, is_private: bool = False) -> str:
         name: Name for the new channel
         is_private: Whether the channel should be private
     """
-    try:
-        client = SlackClient()
-        result = await client.create_channel(name, is_private)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+    client = get_client()
+    result = await client.create_channel(name, is_private)
+    return result
 
 
-@mcp.tool()
-async def archive_channel(channel: str) -> str:
+@_json_tool
+async def archive_channel(channel: str) -> Dict[str, Any]:
     """
     Archive a Slack channel.
 
     Args:
         channel: Channel ID to archive
     """
-    try:
-        client = SlackClient()
-        result = await client.archive_channel(channel)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+    client = get_client()
+    result = await client.archive_channel(channel)
+    return result
 
 
-@mcp.tool()
-async def unarchive_channel(channel: str) -> str:
+@_json_tool
+async def unarchive_channel(channel: str) -> Dict[str, Any]:
     """
     Unarchive a Slack channel.
 
     Args:
         channel: Channel ID to unarchive
     """
-    try:
-        client = SlackClient()
-        result = await client.unarchive_channel(channel)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+    client = get_client()
+    result = await client.unarchive_channel(channel)
+    return result
 
 
-@mcp.tool()
-async def invite_to_channel(channel: str, users: str) -> str:
+@_json_tool
+async def invite_to_channel(channel: str, users: str) -> Dict[str, Any]:
     """
     Invite users to a Slack channel.
 
@@ -512,17 +740,13 @@ async def invite_to_channel(channel: str, users: str) -> str:
         channel: Channel ID
         users: Comma-separated list of user IDs
     """
-    try:
-        client = SlackClient()
-        users_list = users.split(",")
-        result = await client.invite_to_channel(channel, users_list)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+    client = get_client()
+    result = await client.invite_to_channel(channel, users)
+    return result
 
 
-@mcp.tool()
-async def set_channel_topic(channel: str, topic: str) -> str:
+@_json_tool
+async def set_channel_topic(channel: str, topic: str) -> Dict[str, Any]:
     """
     Set the topic for a Slack channel.
 
@@ -530,16 +754,13 @@ async def set_channel_topic(channel: str, topic: str) -> str:
         channel: Channel ID
         topic: New topic text
     """
-    try:
-        client = SlackClient()
-        result = await client.set_channel_topic(channel, topic)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+    client = get_client()
+    result = await client.set_channel_topic(channel, topic)
+    return result
 
 
-@mcp.tool()
-async def set_channel_purpose(channel: str, purpose: str) -> str:
+@_json_tool
+async def set_channel_purpose(channel: str, purpose: str) -> Dict[str, Any]:
     """
     Set the purpose for a Slack channel.
 
@@ -547,26 +768,73 @@ async def set_channel_purpose(channel: str, purpose: str) -> str:
         channel: Channel ID
         purpose: New purpose text
     """
-    try:
-        client = SlackClient()
-        result = await client.set_channel_purpose(channel, purpose)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+    client = get_client()
+    result = await client.set_channel_purpose(channel, purpose)
+    return result
+
+
+# Divider blocks have no per-call state, so every caller shares one dict
+# instead of allocating a fresh one. Treated as immutable by convention.
+_DIVIDER_BLOCK = {"type": "divider"}
+
+def _looks_like_json(s: str) -> bool:
+    """Cheap structural pre-check: a blocks payload must open with '[' or '{'."""
+    s = s.lstrip()
+    return bool(s) and s[0] in "[{"
+
+
+def _parse_blocks(blocks: Union[str, List[Dict[str, Any]], None]) -> Optional[List[Dict[str, Any]]]:
+    """Normalize a blocks argument: parse JSON strings, pass lists through.
+
+    Junk strings fail the structural pre-check and raise before the
+    parser state machine ever runs; the tool wrapper turns the
+    ValueError into the standard error response.
+    """
+    if blocks is None or not isinstance(blocks, str):
+        return blocks
+    if not blocks:
+        return None
+    if not _looks_like_json(blocks):
+        raise ValueError(f"blocks is not valid JSON: {blocks[:50]!r}")
+    return _loads(blocks)
+
+
+# Splits list items on newlines or commas in one pass, instead of scanning
+# the string once for the delimiter check and again for the split
+_LIST_SPLIT = re.compile(r"[\n,]")
+
+# Status emoji/color table for notification messages; read-only by
+# convention, hoisted so the nested dicts aren't rebuilt per call
+_STATUS_CONFIG = {
+    "success": {"emoji": "✅", "color": "#28a745"},
+    "warning": {"emoji": "⚠️", "color": "#ffc107"},
+    "error": {"emoji": "❌", "color": "#dc3545"},
+    "info": {"emoji": "ℹ️", "color": "#17a2b8"},
+}
 
 
 class BlockKitBuilder:
     """Utility class for building Block Kit elements."""
 
+    # header and section memoize their inner text templates: tools re-emit
+    # the same small set of titles and labels over and over (status lines,
+    # poll prompts). Callers get fresh outer and text dicts built from the
+    # cached template, so mutating a returned block can't poison the cache.
+    # List-taking builders (fields_section, context) stay uncached because
+    # their arguments aren't hashable.
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _text_template(text: str, text_type: str) -> Dict[str, str]:
+        """Cached text element for a (text, type) pair; copied on use."""
+        return {"type": text_type, "text": text}
+
     @staticmethod
     def header(text: str) -> Dict[str, Any]:
         """Create a header block."""
         return {
             "type": "header",
-            "text": {
-                "type": "plain_text",
-                "text": text
-            }
+            "text": dict(BlockKitBuilder._text_template(text, "plain_text")),
         }
 
     @staticmethod
@@ -574,29 +842,20 @@ class BlockKitBuilder:
         """Create a section block with text."""
         return {
             "type": "section",
-            "text": {
-                "type": text_type,
-                "text": text
-            }
+            "text": dict(BlockKitBuilder._text_template(text, text_type)),
         }
 
     @staticmethod
     def divider() -> Dict[str, Any]:
         """Create a divider block."""
-        return {"type": "divider"}
+        return _DIVIDER_BLOCK
 
     @staticmethod
     def fields_section(fields: List[str]) -> Dict[str, Any]:
         """Create a section block with multiple fields."""
         return {
             "type": "section",
-            "fields": [
-                {
-                    "type": "mrkdwn",
-                    "text": field
-                }
-                for field in fields
-            ]
+            "fields": [{"type": "mrkdwn", "text": field} for field in fields],
         }
 
     @staticmethod
@@ -604,13 +863,7 @@ class BlockKitBuilder:
         """Create a context block with multiple text elements."""
         return {
             "type": "context",
-            "elements": [
-                {
-                    "type": "mrkdwn",
-                    "text": element
-                }
-                for element in elements
-            ]
+            "elements": [{"type": "mrkdwn", "text": element} for element in elements],
         }
 
     @staticmethod
@@ -649,15 +902,31 @@ class BlockKitBuilder:
 
     @staticmethod
     def actions(*elements) -> Dict[str, Any]:
-        """Create an actions block with interactive elements."""
+        """Create an actions block with interactive elements.
+
+        Accepts either varargs or a single prebuilt list; passing the list
+        avoids the tuple pack/unpack and the copy for large button sets.
+        """
+        if len(elements) == 1 and isinstance(elements[0], list):
+            return {"type": "actions", "elements": elements[0]}
+
         return {
             "type": "actions",
             "elements": list(elements)
         }
 
     @staticmethod
-    def select_menu(placeholder: str, action_id: str, options: List[Dict[str, str]]) -> Dict[str, Any]:
-        """Create a static select menu element."""
+    def select_menu(
+        placeholder: str, action_id: str, options: Union[List[Dict[str, str]], List[tuple]]
+    ) -> Dict[str, Any]:
+        """Create a static select menu element.
+
+        Options may be {"text": ..., "value": ...} dicts or (text, value)
+        pairs; the pair form skips two key lookups per option.
+        """
+        if options and isinstance(options[0], dict):
+            options = [(option["text"], option["value"]) for option in options]
+
         return {
             "type": "static_select",
             "placeholder": {
@@ -665,16 +934,7 @@ class BlockKitBuilder:
                 "text": placeholder
             },
             "action_id": action_id,
-            "options": [
-                {
-                    "text": {
-                        "type": "plain_text",
-                        "text": option["text"]
-                    },
-                    "value": option["value"]
-                }
-                for option in options
-            ]
+            "options": [{"text": {"type": "plain_text", "text": text}, "value": value} for text, value in options],
         }
 
     @staticmethod
@@ -692,13 +952,12 @@ class BlockKitBuilder:
     @staticmethod
     def code_block(code: str, language: Optional[str] = None) -> Dict[str, Any]:
         """Create a formatted code block."""
-        formatted_code = f"```{language + chr(10) if language else ''}{code}```"
+        # join sizes the final string in one allocation, which matters for
+        # the multi-KB dumps send_code_snippet passes through
+        prefix = f"```{language}\n" if language else "```"
         return {
             "type": "section",
-            "text": {
-                "type": "mrkdwn",
-                "text": formatted_code
-            }
+            "text": {"type": "mrkdwn", "text": "".join((prefix, code, "```"))},
         }
 
     @staticmethod
@@ -735,16 +994,45 @@ class BlockKitBuilder:
             "type": "rich_text_list",
             "style": style,
             "elements": [
-                {
-                    "type": "rich_text_section",
-                    "elements": [{"type": "text", "text": item}]
-                }
-                for item in items
-            ]
+                {"type": "rich_text_section", "elements": [{"type": "text", "text": item}]} for item in items
+            ],
         }
 
 
-@mcp.tool()
+def build_announcement_blocks_batch(items: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+    """Build announcement block sets for many items in one tight loop.
+
+    For digest-style generators that render thousands of announcements,
+    this amortizes the builder lookups and the timestamp format over the
+    whole batch instead of paying them per message. Each item is a mapping
+    with "title" and "message" plus optional "author" and "timestamp".
+
+    Kept pure Python on purpose: the work is dict-of-dicts assembly,
+    which neither Numba nor Cython meaningfully accelerates without
+    rewriting the block model around native records.
+    """
+    _header, _section, _context = BlockKitBuilder.header, BlockKitBuilder.section, BlockKitBuilder.context
+    default_stamp = f"*Date:* {_now_stamp()}"
+
+    batch = []
+    append = batch.append
+    for item in items:
+        blocks = [_header("📢 " + item["title"]), _section(item["message"])]
+
+        context_elements = []
+        author = item.get("author")
+        if author:
+            context_elements.append(f"*By:* {author}")
+        timestamp = item.get("timestamp")
+        context_elements.append(f"*Date:* {timestamp}" if timestamp else default_stamp)
+
+        blocks.append(_context(context_elements))
+        append(blocks)
+
+    return batch
+
+
+@_json_tool
 async def send_formatted_message(
     channel: str,
     title: Optional[str] = None,
@@ -752,7 +1040,7 @@ async def send_formatted_message(
     fields: Optional[str] = None,
     context: Optional[str] = None,
     thread_ts: Optional[str] = None
-) -> str:
+) -> Dict[str, Any]:
     """
     Send a formatted message using Block Kit with common elements.
 
@@ -764,35 +1052,32 @@ async def send_formatted_message(
         context: Context text at bottom (optional)
         thread_ts: Thread timestamp for replies (optional)
     """
-    try:
-        blocks = []
-        
-        if title:
-            blocks.append(BlockKitBuilder.header(title))
-        
-        if text:
-            blocks.append(BlockKitBuilder.section(text))
-        
-        if fields:
-            field_list = [field.strip() for field in fields.split(",")]
-            blocks.append(BlockKitBuilder.fields_section(field_list))
-        
-        if context:
-            blocks.append(BlockKitBuilder.context([context]))
-        
-        if not blocks:
-            return json.dumps({"error": "At least one of title, text, fields, or context must be provided"}, indent=2)
-        
-        fallback_text = title or text or "Formatted message"
-        
-        client = SlackClient()
-        result = await client.send_message(channel, fallback_text, thread_ts, blocks)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
-
-
-@mcp.tool()
+    # One list literal with the builder methods bound locally; absent
+    # sections collapse to None and are filtered out in the same pass
+    _header = BlockKitBuilder.header
+    _section = BlockKitBuilder.section
+    _fields = BlockKitBuilder.fields_section
+    _context = BlockKitBuilder.context
+    blocks = [
+        b for b in (
+            _header(title) if title else None,
+            _section(text) if text else None,
+            _fields([f.strip() for f in _LIST_SPLIT.split(fields)]) if fields else None,
+            _context([context]) if context else None,
+        ) if b is not None
+    ]
+    
+    if not blocks:
+        return {"error": "At least one of title, text, fields, or context must be provided"}
+    
+    fallback_text = title or text or "Formatted message"
+    
+    client = get_client()
+    result = await client.send_message(channel, fallback_text, thread_ts, blocks=blocks)
+    return result
+
+
+@_json_tool
 async def send_notification_message(
     channel: str,
     status: str,
@@ -800,7 +1085,7 @@ async def send_notification_message(
     description: str,
     details: Optional[str] = None,
     thread_ts: Optional[str] = None
-) -> str:
+) -> Dict[str, Any]:
     """
     Send a structured notification message with status indicator.
 
@@ -812,48 +1097,38 @@ async def send_notification_message(
         details: Additional details (optional)
         thread_ts: Thread timestamp for replies (optional)
     """
-    try:
-        # Status emojis and colors
-        status_config = {
-            "success": {"emoji": "✅", "color": "#28a745"},
-            "warning": {"emoji": "⚠️", "color": "#ffc107"},
-            "error": {"emoji": "❌", "color": "#dc3545"},
-            "info": {"emoji": "ℹ️", "color": "#17a2b8"}
-        }
-        
-        config = status_config.get(status.lower(), status_config["info"])
-        
-        blocks = [
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": f"{config['emoji']} *{title}*\n{description}"
-                }
+    # Status emojis and colors
+    config = _STATUS_CONFIG.get(status.lower(), _STATUS_CONFIG["info"])
+    
+    blocks = [
+        {
+            "type": "section",
+            "text": {
+                "type": "mrkdwn",
+                "text": f"{config['emoji']} *{title}*\n{description}"
             }
-        ]
-        
-        if details:
-            blocks.append(BlockKitBuilder.divider())
-            blocks.append(BlockKitBuilder.context([details]))
-        
-        fallback_text = f"{config['emoji']} {title}: {description}"
-        
-        client = SlackClient()
-        result = await client.send_message(channel, fallback_text, thread_ts, blocks)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
-
-
-@mcp.tool()
+        }
+    ]
+    
+    if details:
+        blocks.append(BlockKitBuilder.divider())
+        blocks.append(BlockKitBuilder.context([details]))
+    
+    fallback_text = f"{config['emoji']} {title}: {description}"
+    
+    client = get_client()
+    result = await client.send_message(channel, fallback_text, thread_ts, blocks=blocks)
+    return result
+
+
+@_json_tool
 async def send_list_message(
     channel: str,
     title: str,
     items: str,
     description: Optional[str] = None,
     thread_ts: Optional[str] = None
-) -> str:
+) -> Dict[str, Any]:
     """
     Send a formatted list message.
 
@@ -864,40 +1139,40 @@ async def send_list_message(
         description: Optional description text
         thread_ts: Thread timestamp for replies (optional)
     """
-    try:
-        blocks = [BlockKitBuilder.header(title)]
-        
-        if description:
-            blocks.append(BlockKitBuilder.section(description))
-            blocks.append(BlockKitBuilder.divider())
-        
-        # Process items
-        if "\n" in items:
-            item_list = [item.strip() for item in items.split("\n") if item.strip()]
-        else:
-            item_list = [item.strip() for item in items.split(",") if item.strip()]
-        
-        # Create formatted list
-        formatted_items = "\n".join([f"• {item}" for item in item_list])
-        blocks.append(BlockKitBuilder.section(formatted_items))
-        
-        fallback_text = f"{title}: {', '.join(item_list)}"
-        
-        client = SlackClient()
-        result = await client.send_message(channel, fallback_text, thread_ts, blocks)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
-
-
-@mcp.tool()
+    blocks = [BlockKitBuilder.header(title)]
+    
+    if description:
+        blocks.append(BlockKitBuilder.section(description))
+        blocks.append(BlockKitBuilder.divider())
+    
+    # Split, clean and bullet the items in a single pass; the regex
+    # handles both newline- and comma-separated input
+    item_list = []
+    bullets = []
+    for raw in _LIST_SPLIT.split(items):
+        item = raw.strip()
+        if item:
+            item_list.append(item)
+            bullets.append("• " + item)
+    
+    formatted_items = "\n".join(bullets)
+    blocks.append(BlockKitBuilder.section(formatted_items))
+    
+    fallback_text = title + ": " + ", ".join(item_list)
+    
+    client = get_client()
+    result = await client.send_message(channel, fallback_text, thread_ts, blocks=blocks)
+    return result
+
+
+@_json_tool
 async def send_interactive_message(
     channel: str,
     title: str,
     description: str,
     buttons: str,
     thread_ts: Optional[str] = None
-) -> str:
+) -> Dict[str, Any]:
     """
     Send an interactive message with buttons.
 
@@ -908,39 +1183,37 @@ async def send_interactive_message(
         buttons: JSON string of button configurations [{"text": "Button Text", "action_id": "action_1", "style": "primary"}]
         thread_ts: Thread timestamp for replies (optional)
     """
-    try:
-        blocks = [
-            BlockKitBuilder.header(title),
-            BlockKitBuilder.section(description)
-        ]
-        
-        # Parse button configurations
-        button_configs = json.loads(buttons)
-        button_elements = []
-        
-        for btn_config in button_configs:
-            button = BlockKitBuilder.button(
-                text=btn_config["text"],
-                action_id=btn_config["action_id"],
-                value=btn_config.get("value"),
-                url=btn_config.get("url"),
-                style=btn_config.get("style")
-            )
-            button_elements.append(button)
-        
-        if button_elements:
-            blocks.append(BlockKitBuilder.actions(*button_elements))
-        
-        fallback_text = f"{title}: {description}"
-        
-        client = SlackClient()
-        result = await client.send_message(channel, fallback_text, thread_ts, blocks)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
-
-
-@mcp.tool()
+    # Hoist the builder lookups; _button runs once per configured button
+    _header, _section, _button = BlockKitBuilder.header, BlockKitBuilder.section, BlockKitBuilder.button
+
+    blocks = [
+        _header(title),
+        _section(description)
+    ]
+
+    # Parse button configurations and build the elements in one pass
+    button_elements = [
+        _button(
+            text=btn_config["text"],
+            action_id=btn_config["action_id"],
+            value=btn_config.get("value"),
+            url=btn_config.get("url"),
+            style=btn_config.get("style")
+        )
+        for btn_config in _loads(buttons)
+    ]
+
+    if button_elements:
+        blocks.append(BlockKitBuilder.actions(button_elements))
+    
+    fallback_text = f"{title}: {description}"
+    
+    client = get_client()
+    result = await client.send_message(channel, fallback_text, thread_ts, blocks=blocks)
+    return result
+
+
+@_json_tool
 async def send_code_snippet(
     channel: str,
     title: str,
@@ -948,7 +1221,7 @@ async def send_code_snippet(
     language: Optional[str] = None,
     description: Optional[str] = None,
     thread_ts: Optional[str] = None
-) -> str:
+) -> Dict[str, Any]:
     """
     Send a formatted code snippet message.
 
@@ -960,24 +1233,21 @@ async def send_code_snippet(
         description: Optional description
         thread_ts: Thread timestamp for replies (optional)
     """
-    try:
-        blocks = [BlockKitBuilder.header(title)]
-        
-        if description:
-            blocks.append(BlockKitBuilder.section(description))
-        
-        blocks.append(BlockKitBuilder.code_block(code, language))
-        
-        fallback_text = f"{title}: {code[:100]}{'...' if len(code) > 100 else ''}"
-        
-        client = SlackClient()
-        result = await client.send_message(channel, fallback_text, thread_ts, blocks)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
-
-
-@mcp.tool()
+    blocks = [BlockKitBuilder.header(title)]
+    
+    if description:
+        blocks.append(BlockKitBuilder.section(description))
+    
+    blocks.append(BlockKitBuilder.code_block(code, language))
+    
+    fallback_text = f"{title}: {code[:100]}..." if len(code) > 100 else f"{title}: {code}"
+    
+    client = get_client()
+    result = await client.send_message(channel, fallback_text, thread_ts, blocks=blocks)
+    return result
+
+
+@_json_tool
 async def send_form_message(
     channel: str,
     title: str,
@@ -986,7 +1256,7 @@ async def send_form_message(
     select_placeholder: str = "Choose an option",
     select_action_id: str = "form_select",
     thread_ts: Optional[str] = None
-) -> str:
+) -> Dict[str, Any]:
     """
     Send a form-like message with a select menu.
 
@@ -999,36 +1269,34 @@ async def send_form_message(
         select_action_id: Action ID for the select menu
         thread_ts: Thread timestamp for replies (optional)
     """
-    try:
-        blocks = [
-            BlockKitBuilder.header(title),
-            BlockKitBuilder.section(description)
-        ]
-        
-        # Parse select options
-        options = json.loads(select_options)
-        
-        select_menu = BlockKitBuilder.select_menu(
-            placeholder=select_placeholder,
-            action_id=select_action_id,
-            options=options
-        )
-        
-        blocks.append(BlockKitBuilder.section_with_accessory(
-            "Please make your selection:",
-            select_menu
-        ))
-        
-        fallback_text = f"{title}: {description}"
-        
-        client = SlackClient()
-        result = await client.send_message(channel, fallback_text, thread_ts, blocks)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
-
-
-@mcp.tool()
+    blocks = [
+        BlockKitBuilder.header(title),
+        BlockKitBuilder.section(description)
+    ]
+    
+    # Parse select options, validating the {"text", "value"} shape once so
+    # a malformed payload fails here rather than mid-block-build
+    options = [(option["text"], option["value"]) for option in _loads(select_options)]
+
+    select_menu = BlockKitBuilder.select_menu(
+        placeholder=select_placeholder,
+        action_id=select_action_id,
+        options=options
+    )
+    
+    blocks.append(BlockKitBuilder.section_with_accessory(
+        "Please make your selection:",
+        select_menu
+    ))
+    
+    fallback_text = f"{title}: {description}"
+    
+    client = get_client()
+    result = await client.send_message(channel, fallback_text, thread_ts, blocks=blocks)
+    return result
+
+
+@_json_tool
 async def send_announcement(
     channel: str,
     title: str,
@@ -1036,7 +1304,7 @@ async def send_announcement(
     author: Optional[str] = None,
     timestamp: Optional[str] = None,
     thread_ts: Optional[str] = None
-) -> str:
+) -> Dict[str, Any]:
     """
     Send a formatted announcement message.
 
@@ -1048,36 +1316,102 @@ async def send_announcement(
         timestamp: Custom timestamp (optional)
         thread_ts: Thread timestamp for replies (optional)
     """
-    try:
-        blocks = [
-            BlockKitBuilder.header(f"📢 {title}"),
-            BlockKitBuilder.section(message)
-        ]
-        
-        # Add context with author and timestamp
-        context_elements = []
-        if author:
-            context_elements.append(f"*By:* {author}")
-        if timestamp:
-            context_elements.append(f"*Date:* {timestamp}")
-        else:
-            context_elements.append(f"*Date:* {datetime.now().strftime('%Y-%m-%d %H:%M')}")
-        
-        if context_elements:
-            blocks.append(BlockKitBuilder.context(context_elements))
-        
-        fallback_text = f"📢 {title}: {message}"
-        
-        client = SlackClient()
-        result = await client.send_message(channel, fallback_text, thread_ts, blocks)
-        return json.dumps(result, indent=2)
-    except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+    # Format the prefixed title once; it feeds both the header block and
+    # the fallback text
+    header_text = f"📢 {title}"
+
+    _header, _section, _context = BlockKitBuilder.header, BlockKitBuilder.section, BlockKitBuilder.context
+
+    blocks = [
+        _header(header_text),
+        _section(message)
+    ]
+    
+    # Add context with author and timestamp
+    context_elements = []
+    if author:
+        context_elements.append(f"*By:* {author}")
+    if timestamp:
+        context_elements.append(f"*Date:* {timestamp}")
+    else:
+        context_elements.append(f"*Date:* {_now_stamp()}")
+    
+    if context_elements:
+        blocks.append(_context(context_elements))
+    
+    fallback_text = f"{header_text}: {message}"
+    
+    client = get_client()
+    result = await client.send_message(channel, fallback_text, thread_ts, blocks=blocks)
+    return result
+
+
+@_json_tool
+async def send_announcement_multi(
+    channels: str,
+    title: str,
+    message: str,
+    author: Optional[str] = None,
+    timestamp: Optional[str] = None,
+    thread_ts: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Send the same formatted announcement to multiple channels concurrently.
+
+    Args:
+        channels: Comma-separated list of channel IDs or names
+        title: Announcement title
+        message: Main announcement message
+        author: Author name (optional)
+        timestamp: Custom timestamp (optional)
+        thread_ts: Thread timestamp for replies (optional)
+    """
+    header_text = f"📢 {title}"
+
+    # Build the blocks once; every channel gets the same payload
+    _header, _section, _context = BlockKitBuilder.header, BlockKitBuilder.section, BlockKitBuilder.context
+
+    blocks = [
+        _header(header_text),
+        _section(message)
+    ]
+
+    context_elements = []
+    if author:
+        context_elements.append(f"*By:* {author}")
+    if timestamp:
+        context_elements.append(f"*Date:* {timestamp}")
+    else:
+        context_elements.append(f"*Date:* {_now_stamp()}")
+
+    blocks.append(_context(context_elements))
+
+    fallback_text = f"{header_text}: {message}"
+    channel_list = [channel.strip() for channel in channels.split(",") if channel.strip()]
+
+    client = get_client()
+    results = await asyncio.gather(
+        *(client.send_message(channel, fallback_text, thread_ts, blocks=blocks) for channel in channel_list),
+        return_exceptions=True,
+    )
+
+    # Per-channel outcome so one failed post doesn't mask the others
+    outcome = {
+        channel: ({"error": str(result)} if isinstance(result, BaseException) else result)
+        for channel, result in zip(channel_list, results)
+    }
+    return {"ok": all(not isinstance(result, BaseException) for result in results), "results": outcome}
 
 
 def main():
     """Main entry point for the server."""
-    mcp.run()
+    try:
+        mcp.run()
+    finally:
+        # Best-effort close of the pooled HTTP client; at this point the
+        # server loop is gone, so run the cleanup on a fresh one.
+        with contextlib.suppress(Exception):
+            asyncio.run(close_http_client())
 
 
 if __name__ == "__main__":
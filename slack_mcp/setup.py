@@ -3,10 +3,28 @@
 
 import sys
 import getpass
-import re
 from typing import Optional, Dict, Any
 from .credentials import CredentialManager
 
+# Known token prefixes mapped to (minimum plausible length, token kind).
+# Dict dispatch replaces the startswith if/elif chain and makes adding a
+# new token type a one-line change.
+_TOKEN_KINDS = {
+    "xoxb-": (50, "Bot"),
+    "xoxp-": (50, "User"),
+    "xapp-": (100, "App"),
+}
+
+
+def _clean_token(s: str) -> str:
+    """Normalize a pasted secret by dropping all whitespace in one pass.
+
+    Terminal pastes of long tokens often pick up newlines from line
+    wrapping; split()/join removes leading, trailing and embedded
+    whitespace in a single C-level pass, avoiding a validation-retry loop.
+    """
+    return "".join(s.split())
+
 
 def validate_slack_token(token: str) -> tuple[bool, str]:
     """
@@ -21,26 +39,13 @@ def validate_slack_token(token: str) -> tuple[bool, str]:
     if not token:
         return False, "Token cannot be empty"
 
-    # Bot User OAuth Token format: xoxb-*
-    if token.startswith("xoxb-"):
-        if len(token) < 50:  # Typical length is around 50+ characters
-            return False, "Bot token appears too short"
-        return True, ""
+    for prefix, (min_length, kind) in _TOKEN_KINDS.items():
+        if token.startswith(prefix):
+            if len(token) < min_length:
+                return False, f"{kind} token appears too short"
+            return True, ""
 
-    # User OAuth Token format: xoxp-*
-    elif token.startswith("xoxp-"):
-        if len(token) < 50:
-            return False, "User token appears too short"
-        return True, ""
-
-    # App-level Token format: xapp-*
-    elif token.startswith("xapp-"):
-        if len(token) < 100:  # App tokens are longer
-            return False, "App token appears too short"
-        return True, ""
-
-    else:
-        return False, "Invalid token format. Slack tokens should start with 'xoxb-', 'xoxp-', or 'xapp-'"
+    return False, "Invalid token format. Slack tokens should start with 'xoxb-', 'xoxp-', or 'xapp-'"
 
 
 def validate_workspace_id(workspace_id: str) -> tuple[bool, str]:
@@ -56,8 +61,14 @@ def validate_workspace_id(workspace_id: str) -> tuple[bool, str]:
     if not workspace_id:
         return True, ""  # Workspace ID is optional
 
-    # Workspace ID format: T followed by 8+ alphanumeric characters
-    if re.match(r"^T[A-Z0-9]{8,}$", workspace_id):
+    # Workspace ID format: "T" followed by 8+ characters from [A-Z0-9].
+    # For strings this short a direct scan beats regex dispatch and keeps
+    # `re` off the import path entirely.
+    if (
+        len(workspace_id) >= 9
+        and workspace_id[0] == "T"
+        and all("A" <= c <= "Z" or "0" <= c <= "9" for c in workspace_id[1:])
+    ):
         return True, ""
     else:
         return (
@@ -66,23 +77,31 @@ def validate_workspace_id(workspace_id: str) -> tuple[bool, str]:
         )
 
 
+# Static banner text rendered once per menu loop; emitting each as a
+# single write avoids a stdout lock/flush per line on slow terminals
+_HEADER = "🔐 Slack MCP Server - Secure Credential Setup\n" + "=" * 50 + "\n\n"
+
+_TOKEN_HELP = (
+    "📋 How to get your Slack API token:\n"
+    "1. Go to https://api.slack.com/apps\n"
+    "2. Create a new app or select an existing one\n"
+    "3. Navigate to 'OAuth & Permissions'\n"
+    "4. Add required scopes (see README.md)\n"
+    "5. Install the app to your workspace\n"
+    "6. Copy the 'Bot User OAuth Token' (starts with 'xoxb-')\n\n"
+)
+
+
 def print_header():
     """Print the setup header."""
-    print("🔐 Slack MCP Server - Secure Credential Setup")
-    print("=" * 50)
-    print()
+    sys.stdout.write(_HEADER)
+    sys.stdout.flush()
 
 
 def print_token_help():
     """Print help for obtaining Slack tokens."""
-    print("📋 How to get your Slack API token:")
-    print("1. Go to https://api.slack.com/apps")
-    print("2. Create a new app or select an existing one")
-    print("3. Navigate to 'OAuth & Permissions'")
-    print("4. Add required scopes (see README.md)")
-    print("5. Install the app to your workspace")
-    print("6. Copy the 'Bot User OAuth Token' (starts with 'xoxb-')")
-    print()
+    sys.stdout.write(_TOKEN_HELP)
+    sys.stdout.flush()
 
 
 def setup_api_token(manager: CredentialManager) -> bool:
@@ -99,7 +118,7 @@ def setup_api_token(manager: CredentialManager) -> bool:
     print_token_help()
 
     while True:
-        token = getpass.getpass("Enter your Slack API token (input hidden): ").strip()
+        token = _clean_token(getpass.getpass("Enter your Slack API token (input hidden): "))
 
         if not token:
             choice = input("No token entered. Skip API token setup? [y/N]: ").lower()
@@ -172,29 +191,36 @@ def setup_additional_credentials(manager: CredentialManager) -> None:
     print("These are only needed for advanced features:")
     print()
 
+    # Collect everything first, then store in one keychain batch so the
+    # keychain is unlocked at most once for the whole flow
+    pending: Dict[str, str] = {}
+    labels = {"app_token": "App token", "signing_secret": "Signing secret"}
+
     # App token for Socket Mode
     choice = input("Do you need to set up an App Token for Socket Mode? [y/N]: ").lower()
     if choice in ("y", "yes"):
-        app_token = getpass.getpass("Enter your App Token (starts with 'xapp-'): ").strip()
+        app_token = _clean_token(getpass.getpass("Enter your App Token (starts with 'xapp-'): "))
         if app_token:
             is_valid, error_msg = validate_slack_token(app_token)
             if is_valid:
-                if manager.store_credential("app_token", app_token):
-                    print("✅ App token stored securely in keychain")
-                else:
-                    print("❌ Failed to store app token")
+                pending["app_token"] = app_token
             else:
                 print(f"❌ {error_msg}")
 
     # Signing secret
     choice = input("Do you need to set up a Signing Secret for webhook verification? [y/N]: ").lower()
     if choice in ("y", "yes"):
-        signing_secret = getpass.getpass("Enter your Signing Secret: ").strip()
+        signing_secret = _clean_token(getpass.getpass("Enter your Signing Secret: "))
         if signing_secret:
-            if manager.store_credential("signing_secret", signing_secret):
-                print("✅ Signing secret stored securely in keychain")
+            pending["signing_secret"] = signing_secret
+
+    if pending:
+        results = manager.store_credentials(pending)
+        for key, stored in results.items():
+            if stored:
+                print(f"✅ {labels[key]} stored securely in keychain")
             else:
-                print("❌ Failed to store signing secret")
+                print(f"❌ Failed to store {labels[key].lower()}")
 
 
 def verify_setup(manager: CredentialManager) -> None:
@@ -0,0 +1,69 @@
+"""Shared pytest fixtures for the test suite."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(raw):
+    """Decode JSON for test-side assertions, via orjson when installed."""
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def dumps(obj):
+    """Compact JSON encode; orjson's default output carries no whitespace."""
+    return orjson.dumps(obj).decode() if orjson is not None else json.dumps(obj, separators=(",", ":"))
+
+# The fake credentials every test runs against
+TEST_CREDENTIALS = {"api_token": "test-token"}
+
+# Canonical happy-path Slack response shared by the client stubs
+OK_RESPONSE = {"ok": True, "ts": "123456.789"}
+
+
+class FakeSlackClient:
+    """Minimal async stand-in for SlackClient in hot test paths.
+
+    AsyncMock pays for call recording, spec checks and coroutine wrapping
+    on every await; this stub just appends (method, args, kwargs) to
+    ``calls`` and returns the canonical happy-path response.
+    """
+
+    def __init__(self):
+        self.calls = []
+
+    @property
+    def last_call(self):
+        """The most recent (method, args, kwargs) tuple, or None."""
+        return self.calls[-1] if self.calls else None
+
+    async def send_message(self, *args, **kwargs):
+        self.calls.append(("send_message", args, kwargs))
+        return OK_RESPONSE
+
+    async def update_message(self, *args, **kwargs):
+        self.calls.append(("update_message", args, kwargs))
+        return OK_RESPONSE
+
+    async def broadcast_message(self, channels, *args, **kwargs):
+        self.calls.append(("broadcast_message", (channels,) + args, kwargs))
+        return [OK_RESPONSE for _ in channels]
+
+
+@pytest.fixture(scope="session", autouse=True)
+def stub_credentials(request):
+    """Stub the credential lookup once for the whole session.
+
+    Every test uses the same fake token, so the patcher starts a single
+    time here instead of being re-entered per test; tests that need a
+    different shape can still layer their own patch on top.
+    """
+    patcher = patch("slack_mcp.server.get_slack_credentials", return_value=TEST_CREDENTIALS)
+    patcher.start()
+    request.addfinalizer(patcher.stop)
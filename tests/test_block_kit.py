@@ -3,7 +3,7 @@
 import json
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
-from slack_mcp.server import BlockKitBuilder, SlackClient
+from slack_mcp.server import BlockKitBuilder, SlackClient, build_announcement_blocks_batch
 
 
 class TestBlockKitBuilder:
@@ -103,18 +103,23 @@ class TestBlockKitBuilder:
         assert block == expected
 
 
+@pytest.fixture(scope="module")
+def mock_client():
+    """Create a SlackClient with mocked credentials, shared per module.
+
+    The client carries no per-test state (each test patches _make_request
+    itself), so building it once avoids re-entering the credential patch
+    for every test.
+    """
+    with patch('slack_mcp.server.get_slack_credentials') as mock_creds:
+        mock_creds.return_value = {"api_token": "test-token"}
+        client = SlackClient()
+        return client
+
+
 class TestSlackClientBlockSupport:
     """Test SlackClient Block Kit support."""
 
-    @pytest.fixture
-    def mock_client(self):
-        """Create a mock SlackClient."""
-        with patch('slack_mcp.server.get_slack_credentials') as mock_creds:
-            mock_creds.return_value = {"api_token": "test-token"}
-            client = SlackClient()
-            return client
-
-    @pytest.mark.asyncio
     async def test_send_message_with_blocks(self, mock_client):
         """Test sending message with blocks."""
         blocks = [
@@ -143,7 +148,6 @@ class TestSlackClientBlockSupport:
             )
             assert result == {"ok": True, "ts": "123456.789"}
 
-    @pytest.mark.asyncio
     async def test_update_message_with_blocks(self, mock_client):
         """Test updating message with blocks."""
         blocks = [
@@ -174,6 +178,50 @@ class TestSlackClientBlockSupport:
             assert result == {"ok": True, "ts": "123456.789"}
 
 
+    async def test_broadcast_message(self, mock_client):
+        """Test broadcasting keeps results in channel order."""
+        async def fake_send(channel, text, thread_ts=None, blocks=None):
+            return {"ok": True, "channel": channel}
+
+        with patch.object(mock_client, 'send_message', side_effect=fake_send):
+            results = await mock_client.broadcast_message(["C1", "C2", "C3"], "Fanout")
+
+        assert [r["channel"] for r in results] == ["C1", "C2", "C3"]
+        assert all(r["ok"] for r in results)
+
+
+class TestAnnouncementBatchBuilder:
+    """Test the batch announcement block builder."""
+
+    def test_build_announcement_blocks_batch(self):
+        """Test batch building mirrors the single-announcement layout."""
+        items = [
+            {"title": "Release", "message": "v2 is out", "author": "Ops", "timestamp": "2026-01-01"},
+            {"title": "Maintenance", "message": "Window tonight"},
+        ]
+
+        batch = build_announcement_blocks_batch(items)
+
+        assert len(batch) == 2
+
+        first = batch[0]
+        assert first[0] == BlockKitBuilder.header("📢 Release")
+        assert first[1] == BlockKitBuilder.section("v2 is out")
+        context_texts = [element["text"] for element in first[2]["elements"]]
+        assert context_texts == ["*By:* Ops", "*Date:* 2026-01-01"]
+
+        # No author means no By line; the date falls back to today
+        second = batch[1]
+        assert second[0]["text"]["text"] == "📢 Maintenance"
+        context_texts = [element["text"] for element in second[2]["elements"]]
+        assert len(context_texts) == 1
+        assert context_texts[0].startswith("*Date:* ")
+
+    def test_build_announcement_blocks_batch_empty(self):
+        """Test batch building with no items."""
+        assert build_announcement_blocks_batch([]) == []
+
+
 class TestAdvancedBlockKitBuilder:
     """Test the enhanced BlockKitBuilder functionality."""
 
@@ -2,30 +2,90 @@
 
 import json
 import pytest
-from unittest.mock import Mock, AsyncMock, patch
-from slack_mcp.server import BlockKitBuilder, SlackClient
+from unittest.mock import patch
+from slack_mcp.server import BlockKitBuilder, get_client, _loads, _LIST_SPLIT
+
+# The helpers serialize compactly (tests only reparse the result), so
+# they use conftest's whitespace-free dumps rather than the server's
+# pretty-printed _dump
+from .conftest import OK_RESPONSE, FakeSlackClient, dumps as _dump, loads
+
+# One client stub and class stand-in for the whole module; tests get the
+# stub's call log cleared between runs rather than paying patcher
+# enter/exit and mock construction per test. Credential stubbing lives
+# in conftest.py.
+_CLIENT = FakeSlackClient()
+
+# Blocks payload used by the send-with-blocks test; serialized once at
+# import instead of on every run
+_BLOCKS_OBJ = [{"type": "section", "text": {"type": "mrkdwn", "text": "Test message"}}]
+_BLOCKS_JSON = json.dumps(_BLOCKS_OBJ)
+
+# Status emoji/color table for notification messages; read-only by
+# convention, hoisted so the nested dicts aren't rebuilt per call
+_STATUS_CONFIG = {
+    "success": {"emoji": "✅", "color": "#28a745"},
+    "warning": {"emoji": "⚠️", "color": "#ffc107"},
+    "error": {"emoji": "❌", "color": "#dc3545"},
+    "info": {"emoji": "ℹ️", "color": "#17a2b8"},
+}
+_STATUS_GET = _STATUS_CONFIG.get
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _install_client_stub(request):
+    """Park the shared stub in the server's _client slot for this module.
+
+    The _send_*_impl helpers resolve their client through
+    slack_mcp.server.get_client(), which hands back whatever singleton
+    is installed, so no class-level patching is needed.
+    """
+    patcher = patch("slack_mcp.server._client", _CLIENT)
+    patcher.start()
+    request.addfinalizer(patcher.stop)
+
+
+@pytest.fixture
+def fake_client():
+    """Hand tests the shared client stub, with its call log cleared."""
+    _CLIENT.calls.clear()
+    return _CLIENT
+
+
+def _looks_like_json(s: str) -> bool:
+    """Cheap structural pre-check: a JSON blocks payload must open with '[' or '{'.
+
+    Rejecting junk input here skips the full parse (and its exception
+    unwind) for the common failure mode of clearly-non-JSON strings.
+    """
+    s = s.lstrip()
+    return bool(s) and s[0] in "[{"
 
 
 async def _send_message_impl(channel: str, text: str, thread_ts=None, blocks=None):
     """Direct implementation of send_message logic for testing."""
     try:
-        client = SlackClient()
-        blocks_data = json.loads(blocks) if blocks else None
+        if blocks and not _looks_like_json(blocks):
+            return _dump({"error": f"blocks is not valid JSON: {blocks[:50]!r}"})
+        client = get_client()
+        blocks_data = _loads(blocks) if blocks else None
         result = await client.send_message(channel, text, thread_ts, blocks_data)
-        return json.dumps(result, indent=2)
+        return _dump(result)
     except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+        return _dump({"error": str(e)})
 
 
 async def _update_message_impl(channel: str, ts: str, text: str, blocks=None):
     """Direct implementation of update_message logic for testing."""
     try:
-        client = SlackClient()
-        blocks_data = json.loads(blocks) if blocks else None
+        if blocks and not _looks_like_json(blocks):
+            return _dump({"error": f"blocks is not valid JSON: {blocks[:50]!r}"})
+        client = get_client()
+        blocks_data = _loads(blocks) if blocks else None
         result = await client.update_message(channel, ts, text, blocks_data)
-        return json.dumps(result, indent=2)
+        return _dump(result)
     except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+        return _dump({"error": str(e)})
 
 
 async def _send_formatted_message_impl(
@@ -38,31 +98,33 @@ async def _send_formatted_message_impl(
 ):
     """Direct implementation of send_formatted_message logic for testing."""
     try:
-        blocks = []
-        
-        if title:
-            blocks.append(BlockKitBuilder.header(title))
-        
-        if text:
-            blocks.append(BlockKitBuilder.section(text))
-        
-        if fields:
-            field_list = [field.strip() for field in fields.split(",")]
-            blocks.append(BlockKitBuilder.fields_section(field_list))
+        # Validation first: the all-empty case returns before any block
+        # building happens
+        if not (title or text or fields or context):
+            return _dump({"error": "At least one of title, text, fields, or context must be provided"})
         
-        if context:
-            blocks.append(BlockKitBuilder.context([context]))
-        
-        if not blocks:
-            return json.dumps({"error": "At least one of title, text, fields, or context must be provided"}, indent=2)
+        # One list literal with the builder methods bound locally; absent
+        # sections collapse to None and are filtered out in the same pass
+        _header = BlockKitBuilder.header
+        _section = BlockKitBuilder.section
+        _fields = BlockKitBuilder.fields_section
+        _context = BlockKitBuilder.context
+        blocks = [
+            b for b in (
+                _header(title) if title else None,
+                _section(text) if text else None,
+                _fields([f.strip() for f in _LIST_SPLIT.split(fields)]) if fields else None,
+                _context([context]) if context else None,
+            ) if b is not None
+        ]
         
         fallback_text = title or text or "Formatted message"
         
-        client = SlackClient()
+        client = get_client()
         result = await client.send_message(channel, fallback_text, thread_ts, blocks)
-        return json.dumps(result, indent=2)
+        return _dump(result)
     except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+        return _dump({"error": str(e)})
 
 
 async def _send_notification_message_impl(
@@ -75,15 +137,7 @@ async def _send_notification_message_impl(
 ):
     """Direct implementation of send_notification_message logic for testing."""
     try:
-        # Status emojis and colors
-        status_config = {
-            "success": {"emoji": "✅", "color": "#28a745"},
-            "warning": {"emoji": "⚠️", "color": "#ffc107"},
-            "error": {"emoji": "❌", "color": "#dc3545"},
-            "info": {"emoji": "ℹ️", "color": "#17a2b8"}
-        }
-        
-        config = status_config.get(status.lower(), status_config["info"])
+        config = _STATUS_GET(status.lower(), _STATUS_CONFIG["info"])
         
         blocks = [
             {
@@ -101,11 +155,11 @@ async def _send_notification_message_impl(
         
         fallback_text = f"{config['emoji']} {title}: {description}"
         
-        client = SlackClient()
+        client = get_client()
         result = await client.send_message(channel, fallback_text, thread_ts, blocks)
-        return json.dumps(result, indent=2)
+        return _dump(result)
     except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+        return _dump({"error": str(e)})
 
 
 async def _send_list_message_impl(
@@ -123,186 +177,103 @@ async def _send_list_message_impl(
             blocks.append(BlockKitBuilder.section(description))
             blocks.append(BlockKitBuilder.divider())
         
-        # Process items
-        if "\n" in items:
-            item_list = [item.strip() for item in items.split("\n") if item.strip()]
-        else:
-            item_list = [item.strip() for item in items.split(",") if item.strip()]
+        # Split, clean and bullet the items in a single pass; the regex
+        # handles both newline- and comma-separated input
+        item_list = []
+        bullets = []
+        for raw in _LIST_SPLIT.split(items):
+            item = raw.strip()
+            if item:
+                item_list.append(item)
+                bullets.append("• " + item)
         
-        # Create formatted list
-        formatted_items = "\n".join([f"• {item}" for item in item_list])
+        formatted_items = "\n".join(bullets)
         blocks.append(BlockKitBuilder.section(formatted_items))
         
-        fallback_text = f"{title}: {', '.join(item_list)}"
+        fallback_text = title + ": " + ", ".join(item_list)
         
-        client = SlackClient()
+        client = get_client()
         result = await client.send_message(channel, fallback_text, thread_ts, blocks)
-        return json.dumps(result, indent=2)
+        return _dump(result)
     except Exception as e:
-        return json.dumps({"error": str(e)}, indent=2)
+        return _dump({"error": str(e)})
 
 
 class TestFunctionLogic:
     """Test the function logic directly."""
 
-    @pytest.mark.asyncio
-    async def test_send_message_with_blocks(self):
+    async def test_send_message_with_blocks(self, fake_client):
         """Test send_message function logic with blocks parameter."""
-        blocks_json = json.dumps([
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": "Test message"
-                }
-            }
-        ])
+        result = await _send_message_impl("C123", "Fallback text", None, _BLOCKS_JSON)
         
-        with patch('slack_mcp.server.SlackClient') as mock_client_class, \
-             patch('slack_mcp.server.get_slack_credentials', return_value={"api_token": "test-token"}):
-            mock_client = Mock()
-            mock_client.send_message = AsyncMock(return_value={"ok": True, "ts": "123456.789"})
-            mock_client_class.return_value = mock_client
-            
-            result = await _send_message_impl("C123", "Fallback text", None, blocks_json)
-            
-            result_data = json.loads(result)
-            assert result_data == {"ok": True, "ts": "123456.789"}
-            
-            mock_client.send_message.assert_called_once_with(
-                "C123",
-                "Fallback text",
-                None,
-                [{"type": "section", "text": {"type": "mrkdwn", "text": "Test message"}}]
-            )
-
-    @pytest.mark.asyncio
-    async def test_send_message_without_blocks(self):
+        result_data = loads(result)
+        assert result_data == {"ok": True, "ts": "123456.789"}
+        
+        assert fake_client.last_call == (
+            "send_message",
+            ("C123", "Fallback text", None, _BLOCKS_OBJ),
+            {},
+        )
+        assert len(fake_client.calls) == 1
+
+    async def test_send_message_without_blocks(self, fake_client):
         """Test send_message function logic without blocks parameter."""
-        with patch('slack_mcp.server.SlackClient') as mock_client_class, \
-             patch('slack_mcp.server.get_slack_credentials', return_value={"api_token": "test-token"}):
-            mock_client = Mock()
-            mock_client.send_message = AsyncMock(return_value={"ok": True, "ts": "123456.789"})
-            mock_client_class.return_value = mock_client
-            
-            result = await _send_message_impl("C123", "Plain text message")
-            
-            result_data = json.loads(result)
-            assert result_data == {"ok": True, "ts": "123456.789"}
-            
-            mock_client.send_message.assert_called_once_with("C123", "Plain text message", None, None)
-
-    @pytest.mark.asyncio
-    async def test_send_message_invalid_json(self):
+        result = await _send_message_impl("C123", "Plain text message")
+        
+        result_data = loads(result)
+        assert result_data == {"ok": True, "ts": "123456.789"}
+        
+        assert fake_client.calls == [("send_message", ("C123", "Plain text message", None, None), {})]
+
+    async def test_send_message_invalid_json(self, fake_client):
         """Test send_message function logic with invalid blocks JSON."""
-        with patch('slack_mcp.server.SlackClient'), \
-             patch('slack_mcp.server.get_slack_credentials', return_value={"api_token": "test-token"}):
-            result = await _send_message_impl("C123", "Text", None, "invalid json")
-            
-            result_data = json.loads(result)
-            assert "error" in result_data
-
-    @pytest.mark.asyncio
-    async def test_send_formatted_message_full(self):
+        result = await _send_message_impl("C123", "Text", None, "invalid json")
+
+        result_data = loads(result)
+        assert "error" in result_data
+
+    async def test_send_formatted_message_full(self, fake_client):
         """Test send_formatted_message function logic with all parameters."""
-        with patch('slack_mcp.server.SlackClient') as mock_client_class, \
-             patch('slack_mcp.server.get_slack_credentials', return_value={"api_token": "test-token"}):
-            mock_client = Mock()
-            mock_client.send_message = AsyncMock(return_value={"ok": True, "ts": "123456.789"})
-            mock_client_class.return_value = mock_client
-            
-            result = await _send_formatted_message_impl(
-                "C123",
-                "Test Header",
-                "Main content",
-                "Field 1, Field 2",
-                "Context info"
-            )
-            
-            result_data = json.loads(result)
-            assert result_data == {"ok": True, "ts": "123456.789"}
-            
-            # Verify the call was made
-            assert mock_client.send_message.called
-
-    @pytest.mark.asyncio
+        result = await _send_formatted_message_impl(
+            "C123",
+            "Test Header",
+            "Main content",
+            "Field 1, Field 2",
+            "Context info"
+        )
+        
+        result_data = loads(result)
+        assert result_data == {"ok": True, "ts": "123456.789"}
+        
+        # Verify the call was made
+        assert fake_client.last_call is not None
+
     async def test_send_formatted_message_no_content(self):
         """Test send_formatted_message function logic with no content."""
         result = await _send_formatted_message_impl("C123")
         
-        result_data = json.loads(result)
+        result_data = loads(result)
         assert "error" in result_data
 
-    @pytest.mark.asyncio
-    async def test_send_notification_message_success(self):
-        """Test send_notification_message function logic with success status."""
-        with patch('slack_mcp.server.SlackClient') as mock_client_class, \
-             patch('slack_mcp.server.get_slack_credentials', return_value={"api_token": "test-token"}):
-            mock_client = Mock()
-            mock_client.send_message = AsyncMock(return_value={"ok": True, "ts": "123456.789"})
-            mock_client_class.return_value = mock_client
-            
-            result = await _send_notification_message_impl(
-                "C123",
-                "success",
-                "Deployment Complete",
-                "Successfully deployed to production",
-                "Build #123"
-            )
-            
-            result_data = json.loads(result)
-            assert result_data == {"ok": True, "ts": "123456.789"}
-
-    @pytest.mark.asyncio
-    async def test_send_notification_message_unknown_status(self):
-        """Test send_notification_message function logic with unknown status defaults to info."""
-        with patch('slack_mcp.server.SlackClient') as mock_client_class, \
-             patch('slack_mcp.server.get_slack_credentials', return_value={"api_token": "test-token"}):
-            mock_client = Mock()
-            mock_client.send_message = AsyncMock(return_value={"ok": True, "ts": "123456.789"})
-            mock_client_class.return_value = mock_client
-            
-            result = await _send_notification_message_impl(
-                "C123",
-                "unknown",
-                "Some Message",
-                "Description"
-            )
-            
-            result_data = json.loads(result)
-            assert result_data == {"ok": True, "ts": "123456.789"}
-
-    @pytest.mark.asyncio
-    async def test_send_list_message_newline_items(self):
-        """Test send_list_message function logic with newline-separated items."""
-        with patch('slack_mcp.server.SlackClient') as mock_client_class, \
-             patch('slack_mcp.server.get_slack_credentials', return_value={"api_token": "test-token"}):
-            mock_client = Mock()
-            mock_client.send_message = AsyncMock(return_value={"ok": True, "ts": "123456.789"})
-            mock_client_class.return_value = mock_client
-            
-            items = "Item 1\nItem 2\nItem 3"
-            result = await _send_list_message_impl(
-                "C123",
-                "My List",
-                items,
-                "List description"
-            )
-            
-            result_data = json.loads(result)
-            assert result_data == {"ok": True, "ts": "123456.789"}
-
-    @pytest.mark.asyncio
-    async def test_send_list_message_comma_items(self):
-        """Test send_list_message function logic with comma-separated items."""
-        with patch('slack_mcp.server.SlackClient') as mock_client_class, \
-             patch('slack_mcp.server.get_slack_credentials', return_value={"api_token": "test-token"}):
-            mock_client = Mock()
-            mock_client.send_message = AsyncMock(return_value={"ok": True, "ts": "123456.789"})
-            mock_client_class.return_value = mock_client
-            
-            items = "Item 1, Item 2, Item 3"
-            result = await _send_list_message_impl("C123", "My List", items)
-            
-            result_data = json.loads(result)
-            assert result_data == {"ok": True, "ts": "123456.789"}
\ No newline at end of file
+    @pytest.mark.parametrize(("status", "title", "description", "details"), [
+        ("success", "Deployment Complete", "Successfully deployed to production", "Build #123"),
+        # Unknown status falls back to info
+        ("unknown", "Some Message", "Description", None),
+    ])
+    async def test_send_notification_message(self, fake_client, status, title, description, details):
+        """Test send_notification_message function logic across statuses."""
+        result = await _send_notification_message_impl("C123", status, title, description, details)
+
+        result_data = loads(result)
+        assert result_data == {"ok": True, "ts": "123456.789"}
+
+    @pytest.mark.parametrize(("items", "description"), [
+        ("Item 1\nItem 2\nItem 3", "List description"),
+        ("Item 1, Item 2, Item 3", None),
+    ])
+    async def test_send_list_message(self, fake_client, items, description):
+        """Test send_list_message function logic with either item separator."""
+        result = await _send_list_message_impl("C123", "My List", items, description)
+
+        result_data = loads(result)
+        assert result_data == OK_RESPONSE
\ No newline at end of file
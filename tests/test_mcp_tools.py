@@ -2,283 +2,234 @@
 
 import json
 import pytest
-from unittest.mock import Mock, AsyncMock, patch
 import slack_mcp.server as server
 
+from .conftest import OK_RESPONSE as _OK, FakeSlackClient, loads
+
+# Blocks payloads serialized once at import instead of in every test body
+_SECTION_BLOCKS_OBJ = [{"type": "section", "text": {"type": "mrkdwn", "text": "Test message"}}]
+_SECTION_BLOCKS_JSON = json.dumps(_SECTION_BLOCKS_OBJ)
+_UPDATED_BLOCKS_OBJ = [{"type": "section", "text": {"type": "mrkdwn", "text": "Updated message"}}]
+_UPDATED_BLOCKS_JSON = json.dumps(_UPDATED_BLOCKS_OBJ)
+
+# One recording stub shared by every test; its call log is cleared
+# between tests instead of paying mock construction per test
+_CLIENT = FakeSlackClient()
+
+
+@pytest.fixture
+def mock_client(monkeypatch):
+    """Install the shared recording stub and hand it back, cleared.
+
+    The stub goes straight into the server's _client singleton slot, so
+    get_client() hands it out without any production-side test hooks.
+    monkeypatch.setattr swaps the attribute directly, skipping the
+    _patch enter/exit machinery of unittest.mock.patch; the stub's plain
+    calls list replaces Mock call-args introspection in assertions.
+    """
+    _CLIENT.calls.clear()
+    monkeypatch.setattr(server, "_client", _CLIENT)
+    return _CLIENT
+
 
 class TestEnhancedMCPTools:
     """Test the enhanced MCP tools with Block Kit support."""
 
-    @pytest.mark.asyncio
-    async def test_send_message_with_blocks(self):
+    async def test_send_message_with_blocks(self, mock_client):
         """Test send_message MCP tool with blocks parameter."""
-        blocks_json = json.dumps([
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": "Test message"
-                }
-            }
-        ])
+        result = await server.send_message("C123", "Fallback text", None, _SECTION_BLOCKS_JSON)
         
-        with patch('slack_mcp.server.SlackClient') as mock_client_class:
-            mock_client = Mock()
-            mock_client.send_message = AsyncMock(return_value={"ok": True, "ts": "123456.789"})
-            mock_client_class.return_value = mock_client
-            
-            result = await server.send_message("C123", "Fallback text", None, blocks_json)
-            
-            result_data = json.loads(result)
-            assert result_data == {"ok": True, "ts": "123456.789"}
-            
-            mock_client.send_message.assert_called_once_with(
-                "C123",
-                "Fallback text",
-                None,
-                [{"type": "section", "text": {"type": "mrkdwn", "text": "Test message"}}]
-            )
+        result_data = loads(result)
+        assert result_data == _OK
+        
+        assert mock_client.calls == [
+            ("send_message", ("C123", "Fallback text", None, _SECTION_BLOCKS_OBJ), {}),
+        ]
 
-    @pytest.mark.asyncio
-    async def test_send_message_without_blocks(self):
+    async def test_send_message_without_blocks(self, mock_client):
         """Test send_message MCP tool without blocks parameter."""
-        with patch('slack_mcp.server.SlackClient') as mock_client_class:
-            mock_client = Mock()
-            mock_client.send_message = AsyncMock(return_value={"ok": True, "ts": "123456.789"})
-            mock_client_class.return_value = mock_client
-            
-            result = await server.send_message("C123", "Plain text message")
-            
-            result_data = json.loads(result)
-            assert result_data == {"ok": True, "ts": "123456.789"}
-            
-            mock_client.send_message.assert_called_once_with("C123", "Plain text message", None, None)
-
-    @pytest.mark.asyncio
-    async def test_send_message_invalid_json(self):
+        result = await server.send_message("C123", "Plain text message")
+        
+        result_data = loads(result)
+        assert result_data == _OK
+        
+        assert mock_client.calls == [("send_message", ("C123", "Plain text message", None, None), {})]
+
+    async def test_send_message_invalid_json(self, mock_client):
         """Test send_message MCP tool with invalid blocks JSON."""
-        with patch('slack_mcp.server.SlackClient'):
-            result = await server.send_message("C123", "Text", None, "invalid json")
-            
-            result_data = json.loads(result)
-            assert "error" in result_data
-
-    @pytest.mark.asyncio
-    async def test_update_message_with_blocks(self):
+        result = await server.send_message("C123", "Text", None, "invalid json")
+
+        result_data = loads(result)
+        assert "error" in result_data
+
+    async def test_update_message_with_blocks(self, mock_client):
         """Test update_message MCP tool with blocks parameter."""
-        blocks_json = json.dumps([
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": "Updated message"
-                }
-            }
-        ])
+        result = await server.update_message("C123", "123456.789", "Updated text", _UPDATED_BLOCKS_JSON)
         
-        with patch('slack_mcp.server.SlackClient') as mock_client_class:
-            mock_client = Mock()
-            mock_client.update_message = AsyncMock(return_value={"ok": True, "ts": "123456.789"})
-            mock_client_class.return_value = mock_client
-            
-            result = await server.update_message("C123", "123456.789", "Updated text", blocks_json)
-            
-            result_data = json.loads(result)
-            assert result_data == {"ok": True, "ts": "123456.789"}
-            
-            mock_client.update_message.assert_called_once_with(
-                "C123",
-                "123456.789",
-                "Updated text",
-                [{"type": "section", "text": {"type": "mrkdwn", "text": "Updated message"}}]
-            )
+        result_data = loads(result)
+        assert result_data == _OK
+        
+        assert mock_client.calls == [
+            ("update_message", ("C123", "123456.789", "Updated text", _UPDATED_BLOCKS_OBJ), {}),
+        ]
 
-    @pytest.mark.asyncio
-    async def test_update_message_without_blocks(self):
+    async def test_update_message_without_blocks(self, mock_client):
         """Test update_message MCP tool without blocks parameter."""
-        with patch('slack_mcp.server.SlackClient') as mock_client_class:
-            mock_client = Mock()
-            mock_client.update_message = AsyncMock(return_value={"ok": True, "ts": "123456.789"})
-            mock_client_class.return_value = mock_client
-            
-            result = await server.update_message("C123", "123456.789", "Plain updated text")
-            
-            result_data = json.loads(result)
-            assert result_data == {"ok": True, "ts": "123456.789"}
-            
-            mock_client.update_message.assert_called_once_with("C123", "123456.789", "Plain updated text", None)
+        result = await server.update_message("C123", "123456.789", "Plain updated text")
+        
+        result_data = loads(result)
+        assert result_data == _OK
+        
+        assert mock_client.calls == [("update_message", ("C123", "123456.789", "Plain updated text", None), {})]
 
 
 class TestNewBlockKitTools:
     """Test the new Block Kit-specific MCP tools."""
 
-    @pytest.mark.asyncio
-    async def test_send_formatted_message_full(self):
+    async def test_send_formatted_message_full(self, mock_client):
         """Test send_formatted_message with all parameters."""
-        with patch('slack_mcp.server.SlackClient') as mock_client_class:
-            mock_client = Mock()
-            mock_client.send_message = AsyncMock(return_value={"ok": True, "ts": "123456.789"})
-            mock_client_class.return_value = mock_client
-            
-            result = await server.send_formatted_message(
-                "C123",
-                "Test Header",
-                "Main content",
-                "Field 1, Field 2",
-                "Context info"
-            )
-            
-            result_data = json.loads(result)
-            assert result_data == {"ok": True, "ts": "123456.789"}
-            
-            # Verify the blocks structure
-            call_args = mock_client.send_message.call_args
-            blocks = call_args[1]["blocks"]
-            
-            assert len(blocks) == 4  # header, section, fields_section, context
-            assert blocks[0]["type"] == "header"
-            assert blocks[1]["type"] == "section"
-            assert blocks[2]["type"] == "section" and "fields" in blocks[2]
-            assert blocks[3]["type"] == "context"
-
-    @pytest.mark.asyncio
-    async def test_send_formatted_message_minimal(self):
+        result = await server.send_formatted_message(
+            "C123",
+            "Test Header",
+            "Main content",
+            "Field 1, Field 2",
+            "Context info"
+        )
+        
+        result_data = loads(result)
+        assert result_data == _OK
+        
+        # Verify the blocks structure
+        _method, _args, kwargs = mock_client.last_call
+        blocks = kwargs["blocks"]
+        
+        assert len(blocks) == 4  # header, section, fields_section, context
+        assert blocks[0]["type"] == "header"
+        assert blocks[1]["type"] == "section"
+        assert blocks[2]["type"] == "section" and "fields" in blocks[2]
+        assert blocks[3]["type"] == "context"
+
+    async def test_send_formatted_message_minimal(self, mock_client):
         """Test send_formatted_message with minimal parameters."""
-        with patch('slack_mcp.server.SlackClient') as mock_client_class:
-            mock_client = Mock()
-            mock_client.send_message = AsyncMock(return_value={"ok": True, "ts": "123456.789"})
-            mock_client_class.return_value = mock_client
-            
-            result = await server.send_formatted_message("C123", "Just a title")
-            
-            result_data = json.loads(result)
-            assert result_data == {"ok": True, "ts": "123456.789"}
-
-    @pytest.mark.asyncio
+        result = await server.send_formatted_message("C123", "Just a title")
+        
+        result_data = loads(result)
+        assert result_data == _OK
+
     async def test_send_formatted_message_no_content(self):
         """Test send_formatted_message with no content."""
         result = await server.send_formatted_message("C123")
         
-        result_data = json.loads(result)
+        result_data = loads(result)
         assert "error" in result_data
 
-    @pytest.mark.asyncio
-    async def test_send_notification_message_success(self):
-        """Test send_notification_message with success status."""
-        with patch('slack_mcp.server.SlackClient') as mock_client_class:
-            mock_client = Mock()
-            mock_client.send_message = AsyncMock(return_value={"ok": True, "ts": "123456.789"})
-            mock_client_class.return_value = mock_client
-            
-            result = await server.send_notification_message(
-                "C123",
-                "success",
-                "Deployment Complete",
-                "Successfully deployed to production",
-                "Build #123"
-            )
-            
-            result_data = json.loads(result)
-            assert result_data == {"ok": True, "ts": "123456.789"}
-            
-            # Verify the blocks contain success emoji
-            call_args = mock_client.send_message.call_args
-            blocks = call_args[1]["blocks"]
-            assert "✅" in blocks[0]["text"]["text"]
-
-    @pytest.mark.asyncio
-    async def test_send_notification_message_error(self):
-        """Test send_notification_message with error status."""
-        with patch('slack_mcp.server.SlackClient') as mock_client_class:
-            mock_client = Mock()
-            mock_client.send_message = AsyncMock(return_value={"ok": True, "ts": "123456.789"})
-            mock_client_class.return_value = mock_client
-            
-            result = await server.send_notification_message(
-                "C123",
-                "error",
-                "Deployment Failed",
-                "Deployment failed with errors"
-            )
-            
-            result_data = json.loads(result)
-            assert result_data == {"ok": True, "ts": "123456.789"}
-            
-            # Verify the blocks contain error emoji
-            call_args = mock_client.send_message.call_args
-            blocks = call_args[1]["blocks"]
-            assert "❌" in blocks[0]["text"]["text"]
-
-    @pytest.mark.asyncio
-    async def test_send_notification_message_unknown_status(self):
-        """Test send_notification_message with unknown status defaults to info."""
-        with patch('slack_mcp.server.SlackClient') as mock_client_class:
-            mock_client = Mock()
-            mock_client.send_message = AsyncMock(return_value={"ok": True, "ts": "123456.789"})
-            mock_client_class.return_value = mock_client
-            
-            result = await server.send_notification_message(
-                "C123",
-                "unknown",
-                "Some Message",
-                "Description"
-            )
-            
-            # Should default to info emoji
-            call_args = mock_client.send_message.call_args
-            blocks = call_args[1]["blocks"]
-            assert "ℹ️" in blocks[0]["text"]["text"]
-
-    @pytest.mark.asyncio
-    async def test_send_list_message_newline_items(self):
-        """Test send_list_message with newline-separated items."""
-        with patch('slack_mcp.server.SlackClient') as mock_client_class:
-            mock_client = Mock()
-            mock_client.send_message = AsyncMock(return_value={"ok": True, "ts": "123456.789"})
-            mock_client_class.return_value = mock_client
-            
-            items = "Item 1\nItem 2\nItem 3"
-            result = await server.send_list_message(
-                "C123",
-                "My List",
-                items,
-                "List description"
+    @pytest.mark.parametrize(("status", "emoji", "details"), [
+        ("success", "✅", "Build #123"),
+        ("error", "❌", None),
+        # Unknown status falls back to the info emoji
+        ("unknown", "ℹ️", None),
+    ])
+    async def test_send_notification_message(self, mock_client, status, emoji, details):
+        """Test send_notification_message across statuses."""
+        result = await server.send_notification_message(
+            "C123",
+            status,
+            "Some Message",
+            "Description",
+            details
+        )
+
+        result_data = loads(result)
+        assert result_data == _OK
+
+        # Verify the blocks carry the status emoji
+        _method, _args, kwargs = mock_client.last_call
+        blocks = kwargs["blocks"]
+        assert emoji in blocks[0]["text"]["text"]
+
+    @pytest.mark.parametrize(("items", "description", "expected_block_count"), [
+        # With a description: header, section, divider, list section
+        ("Item 1\nItem 2\nItem 3", "List description", 4),
+        # Without: header and list section only
+        ("Item 1, Item 2, Item 3", None, 2),
+    ])
+    async def test_send_list_message(self, mock_client, items, description, expected_block_count):
+        """Test send_list_message with either item separator."""
+        result = await server.send_list_message("C123", "My List", items, description)
+
+        result_data = loads(result)
+        assert result_data == _OK
+
+        _method, _args, kwargs = mock_client.last_call
+        blocks = kwargs["blocks"]
+        assert len(blocks) == expected_block_count
+        assert blocks[0]["type"] == "header"
+        list_section = blocks[-1]
+        assert list_section["type"] == "section"
+        assert "• Item 1" in list_section["text"]["text"]
+        assert "• Item 2" in list_section["text"]["text"]
+        assert "• Item 3" in list_section["text"]["text"]
+
+class TestBroadcastTools:
+    """Test the multi-channel fan-out MCP tools."""
+
+    async def test_broadcast_message(self, mock_client):
+        """Test broadcast_message aggregates per-channel results."""
+        result = await server.broadcast_message("C123, C456", "Fanout text")
+
+        result_data = loads(result)
+        assert result_data == {"ok": True, "results": [_OK, _OK]}
+
+        assert mock_client.calls == [
+            ("broadcast_message", (["C123", "C456"], "Fanout text", None, None), {}),
+        ]
+
+    async def test_broadcast_message_invalid_json(self, mock_client):
+        """Test broadcast_message with invalid blocks JSON."""
+        result = await server.broadcast_message("C123", "Text", None, "invalid json")
+
+        result_data = loads(result)
+        assert "error" in result_data
+        assert mock_client.calls == []
+
+    async def test_send_announcement_multi(self, mock_client):
+        """Test send_announcement_multi maps results per channel."""
+        result = await server.send_announcement_multi(
+            "C123,C456", "Release", "v2 is out", "Ops"
+        )
+
+        result_data = loads(result)
+        assert result_data["ok"] is True
+        assert result_data["results"] == {"C123": _OK, "C456": _OK}
+
+        # One send per channel, all carrying the same announcement blocks
+        assert len(mock_client.calls) == 2
+        for (method, args, kwargs), channel in zip(mock_client.calls, ("C123", "C456")):
+            assert method == "send_message"
+            assert args == (channel, "📢 Release: v2 is out", None)
+            blocks = kwargs["blocks"]
+            assert blocks[0]["text"]["text"] == "📢 Release"
+            assert blocks[2]["elements"][0]["text"] == "*By:* Ops"
+
+
+class TestToolProtocol:
+    """Exercise a tool through the actual MCP registration path.
+
+    The other tests await the wrapper functions directly, which skips
+    FastMCP's schema generation and result conversion; this one goes
+    through an in-memory client so a registration regression (e.g. a
+    wrong return annotation) fails here instead of in production.
+    """
+
+    async def test_call_tool_over_protocol(self, mock_client):
+        """Tools return JSON text when invoked via an in-memory MCP client."""
+        from fastmcp import Client
+
+        async with Client(server.mcp) as client:
+            res = await client.call_tool(
+                "send_formatted_message",
+                {"channel": "C123", "title": "Test Header", "text": "Main content"},
             )
-            
-            result_data = json.loads(result)
-            assert result_data == {"ok": True, "ts": "123456.789"}
-            
-            # Verify the blocks structure
-            call_args = mock_client.send_message.call_args
-            blocks = call_args[1]["blocks"]
-            
-            # Should have header, section (description), divider, and list section
-            assert len(blocks) == 4
-            assert blocks[0]["type"] == "header"
-            assert blocks[1]["type"] == "section"  # description
-            assert blocks[2]["type"] == "divider"
-            assert blocks[3]["type"] == "section"  # list
-            assert "• Item 1" in blocks[3]["text"]["text"]
-            assert "• Item 2" in blocks[3]["text"]["text"]
-            assert "• Item 3" in blocks[3]["text"]["text"]
-
-    @pytest.mark.asyncio
-    async def test_send_list_message_comma_items(self):
-        """Test send_list_message with comma-separated items."""
-        with patch('slack_mcp.server.SlackClient') as mock_client_class:
-            mock_client = Mock()
-            mock_client.send_message = AsyncMock(return_value={"ok": True, "ts": "123456.789"})
-            mock_client_class.return_value = mock_client
-            
-            items = "Item 1, Item 2, Item 3"
-            result = await server.send_list_message("C123", "My List", items)
-            
-            result_data = json.loads(result)
-            assert result_data == {"ok": True, "ts": "123456.789"}
-            
-            # Should have header and list section (no description or divider)
-            call_args = mock_client.send_message.call_args
-            blocks = call_args[1]["blocks"]
-            assert len(blocks) == 2
-            assert blocks[0]["type"] == "header"
-            assert blocks[1]["type"] == "section"  # list
\ No newline at end of file
+
+        result_data = loads(res.content[0].text)
+        assert result_data == _OK